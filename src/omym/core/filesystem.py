@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import errno
 import os
+import shutil
+from collections.abc import Iterable
 from pathlib import Path
 
 
@@ -25,19 +28,67 @@ def ensure_parent_directory(path: Path) -> Path:
     return ensure_directory(parent)
 
 
+def move_file(src: Path, dest: Path) -> None:
+    """Move ``src`` to ``dest``, preferring an atomic rename on the same filesystem.
+
+    ``os.rename`` relinks the inode in a single syscall; ``shutil.move`` is only used when
+    the destination lives on another device and the data has to be copied. Unlike
+    ``os.replace``, ``os.rename`` refuses to overwrite an existing file on Windows, so a
+    destination created after the caller's existence check is not clobbered there.
+    """
+
+    try:
+        os.rename(src, dest)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        _ = shutil.move(str(src), str(dest))
+
+
 def remove_empty_directories(directory: Path) -> None:
-    """Recursively remove empty directories starting from the given root."""
+    """Recursively remove empty directories starting from the given root.
+
+    The walk is bottom-up and each directory is removed with a bare ``os.rmdir``; the
+    kernel refuses non-empty directories, so no separate listing or stat is needed.
+    """
+
+    for root, _, _ in os.walk(directory, topdown=False):
+        try:
+            os.rmdir(root)
+        except OSError:
+            # Not empty, already gone, or not removable: leave it in place.
+            continue
+
+
+def prune_empty_directories(directories: Iterable[Path], root: Path) -> None:
+    """Remove ``directories`` and their ancestors up to ``root`` when they are empty.
+
+    Only the given directories (typically those vacated by moves) and their parents are
+    visited, deepest first, instead of walking the whole tree under ``root``. Directories
+    outside ``root`` are ignored; ``root`` itself is removed if it ends up empty.
+    """
 
-    if not directory.exists():
-        return
+    candidates: set[Path] = set()
+    for directory in directories:
+        current = directory
+        while current not in candidates and current.is_relative_to(root):
+            candidates.add(current)
+            if current == root:
+                break
+            current = current.parent
 
-    for root, _, _ in os.walk(str(directory), topdown=False):
-        root_path = Path(root)
+    for candidate in sorted(candidates, key=lambda path: len(path.parts), reverse=True):
         try:
-            if root_path.exists() and not any(root_path.iterdir()):
-                root_path.rmdir()
+            candidate.rmdir()
         except OSError:
+            # Not empty, already gone, or not removable: leave it in place.
             continue
 
 
-__all__ = ["ensure_directory", "ensure_parent_directory", "remove_empty_directories"]
+__all__ = [
+    "ensure_directory",
+    "ensure_parent_directory",
+    "move_file",
+    "prune_empty_directories",
+    "remove_empty_directories",
+]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
 from typing import Callable
 
@@ -55,6 +56,19 @@ def _default_transliterator(text: str) -> str:
         return text
 
 
+class _FetchContext(threading.local):
+    """Per-thread record of where the most recent fetch obtained its value."""
+
+    source: str | None
+    original: str | None
+    value: str | None
+
+    def __init__(self) -> None:
+        self.source = None
+        self.original = None
+        self.value = None
+
+
 @dataclass(slots=True)
 class ArtistRomanizer:
     """Romanize artist names using MusicBrainz WS2.
@@ -69,9 +83,11 @@ class ArtistRomanizer:
     language_detector: LanguageDetector = field(default=_default_language_detector)
     transliterator: Transliterator = field(default=_default_transliterator)
     _cache: dict[str, str] = field(default_factory=dict, init=False)
-    _last_fetch_source: str | None = field(default=None, init=False, repr=False)
-    _last_fetch_original: str | None = field(default=None, init=False, repr=False)
-    _last_fetch_value: str | None = field(default=None, init=False, repr=False)
+    # Thread-local so concurrent romanizations cannot consume each other's context.
+    _fetch_context: _FetchContext = field(default_factory=_FetchContext, init=False, repr=False)
+    # Per-name locks so threads asking for the same uncached name share a single lookup.
+    _name_locks: dict[str, threading.Lock] = field(default_factory=dict, init=False, repr=False)
+    _name_locks_guard: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
     def record_fetch_context(
         self,
@@ -82,25 +98,19 @@ class ArtistRomanizer:
     ) -> None:
         """Record how the most recent fetch obtained its value."""
 
-        self._last_fetch_source = source
-        self._last_fetch_original = original
-        self._last_fetch_value = value
+        context = self._fetch_context
+        context.source = source
+        context.original = original
+        context.value = value
 
     def _consume_fetch_context(self, original: str, value: str | None) -> str | None:
-        if (
-            self._last_fetch_original == original
-            and self._last_fetch_value == value
-            and self._last_fetch_source is not None
-        ):
-            source = self._last_fetch_source
-            self._last_fetch_source = None
-            self._last_fetch_original = None
-            self._last_fetch_value = None
-            return source
-        self._last_fetch_source = None
-        self._last_fetch_original = None
-        self._last_fetch_value = None
-        return None
+        context = self._fetch_context
+        source = context.source
+        matched = context.original == original and context.value == value
+        context.source = None
+        context.original = None
+        context.value = None
+        return source if matched else None
 
     def romanize_name(self, name: str | None) -> str | None:
         """Return a romanized version of an artist name when available.
@@ -135,6 +145,15 @@ class ArtistRomanizer:
             logger.debug("Using cached romanized name for '%s': %s", text, cached)
             return cached
 
+        with self._name_locks_guard:
+            name_lock = self._name_locks.setdefault(text, threading.Lock())
+        with name_lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                return cached
+            return self._romanize_uncached(text)
+
+    def _romanize_uncached(self, text: str) -> str:
         detected_lang = self.language_detector(text)
         if detected_lang not in _TARGET_LANGS:
             self._cache[text] = text
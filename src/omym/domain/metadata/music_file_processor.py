@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import logging
-import shutil
+import mmap
+import os
 import sqlite3
+import threading
 import time
 import uuid
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import StrEnum
 from pathlib import Path
-from collections.abc import Iterable
-from typing import Any, Callable, ClassVar, final
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Callable, ClassVar, Final, final
 
 from omym.config.artist_name_preferences import (
     ArtistNamePreferenceError,
@@ -21,7 +24,7 @@ from omym.config.artist_name_preferences import (
     load_artist_name_preferences,
 )
 
-from omym.core.filesystem import ensure_parent_directory, remove_empty_directories
+from omym.core.filesystem import ensure_parent_directory, move_file, prune_empty_directories
 from omym.domain.metadata.artist_romanizer import ArtistRomanizer
 from omym.domain.metadata.track_metadata import TrackMetadata
 from omym.domain.metadata.track_metadata_extractor import MetadataExtractor
@@ -31,16 +34,33 @@ from omym.domain.path.music_file_renamer import (
     CachedArtistIdGenerator,
 )
 from omym.infra.db.cache.artist_cache_dao import ArtistCacheDAO
+from omym.infra.db.cache.file_hash_cache_dao import FileHashCacheDAO
 from omym.infra.db.daos.processing_after_dao import ProcessingAfterDAO
 from omym.infra.db.daos.processing_before_dao import ProcessingBeforeDAO
 from omym.infra.db.db_manager import DatabaseManager
-from omym.infra.logger.logger import logger
+from omym.infra.logger.logger import logger, queued_log_handlers
 from omym.infra.musicbrainz.client import (
     configure_romanization_cache,
     fetch_romanized_name,
 )
 
 
+# posix_fadvise is only available on POSIX platforms (not Windows or macOS).
+_HAS_POSIX_FADVISE: Final[bool] = hasattr(os, "posix_fadvise")
+
+# User-facing explanations for lyrics that could not be moved, keyed by result reason.
+_LYRICS_REASON_MESSAGES: Final[Mapping[str, str]] = {
+    "target_exists": "target already exists",
+    "lyrics_source_missing": "source lyrics missing",
+}
+
+# User-facing explanations for artwork that could not be moved, keyed by result reason.
+_ARTWORK_REASON_MESSAGES: Final[Mapping[str, str]] = {
+    "target_exists": "target already exists",
+    "source_missing": "source artwork missing",
+    "already_at_target": "already at destination",
+    "no_target_track": "target track unavailable",
+}
 
 
 class ProcessingEvent(StrEnum):
@@ -82,6 +102,17 @@ class ProcessingLogContext:
     processed: int = 0
     skipped: int = 0
     failed: int = 0
+    _static_extra: dict[str, Any] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the logging extras that stay fixed for the whole run."""
+
+        self._static_extra = {
+            "process_id": self.process_id,
+            "directory": str(self.directory),
+            "total_files": self.total_files,
+            "dry_run": self.dry_run,
+        }
 
     def record_success(self) -> None:
         """Increment the counter of successfully processed files."""
@@ -106,14 +137,10 @@ class ProcessingLogContext:
     def summary_extra(self) -> dict[str, Any]:
         """Return a dictionary suitable for structured logging extras."""
 
-        return {
-            "process_id": self.process_id,
-            "directory": str(self.directory),
-            "total_files": self.total_files,
+        return self._static_extra | {
             "processed": self.processed,
             "skipped": self.skipped,
             "failed": self.failed,
-            "dry_run": self.dry_run,
             "duration_seconds": round(self.duration_seconds(), 4),
         }
 
@@ -172,6 +199,15 @@ class ArtworkProcessingResult:
     reason: str | None = None
 
 
+@dataclass(slots=True, frozen=True)
+class _DirectoryListing:
+    """Files of one source folder, partitioned by the role they play for a track."""
+
+    tracks: tuple[Path, ...] = ()
+    artworks: tuple[Path, ...] = ()
+    lyrics_by_stem: dict[str, tuple[Path, ...]] = field(default_factory=dict)
+
+
 @final
 class _DryRunArtistCacheAdapter:
     """Artist cache adapter that avoids persistent writes during dry runs."""
@@ -224,6 +260,23 @@ class _DryRunArtistCacheAdapter:
             return in_memory[0]
         return self._delegate.get_romanized_name(artist_name)
 
+    def get_romanized_names(self, artist_names: Iterable[str]) -> dict[str, str]:
+        resolved: dict[str, str] = {}
+        pending: list[str] = []
+        for artist_name in artist_names:
+            normalized_name = artist_name.strip()
+            if not normalized_name:
+                continue
+            in_memory = self._memory_romanized.get(normalized_name)
+            if in_memory:
+                resolved[normalized_name] = in_memory[0]
+            else:
+                pending.append(normalized_name)
+        if pending:
+            for key, value in self._delegate.get_romanized_names(pending).items():
+                _ = resolved.setdefault(key, value)
+        return resolved
+
     def clear_cache(self) -> bool:
         self._memory_artist_ids.clear()
         self._memory_romanized.clear()
@@ -235,9 +288,28 @@ class MusicProcessor:
     """Process music files for organization."""
 
     # Supported file extensions.
-    SUPPORTED_EXTENSIONS: ClassVar[set[str]] = {".mp3", ".flac", ".m4a", ".dsf", ".aac", ".alac", ".opus"}
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset(
+        {".mp3", ".flac", ".m4a", ".dsf", ".aac", ".alac", ".opus"}
+    )
+
+    SUPPORTED_IMAGE_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({".jpg", ".png"})
+
+    # Suffix tuples for ``str.endswith`` checks against lowercased file names.
+    _SUPPORTED_SUFFIXES: ClassVar[tuple[str, ...]] = tuple(sorted(SUPPORTED_EXTENSIONS))
+    _SUPPORTED_IMAGE_SUFFIXES: ClassVar[tuple[str, ...]] = tuple(sorted(SUPPORTED_IMAGE_EXTENSIONS))
+
+    # Files at least this large are memory-mapped for hashing instead of streamed.
+    MMAP_THRESHOLD: ClassVar[int] = 8 * 1024 * 1024
+
+    # Upper bound on concurrent hashing threads used by ``process_directory``.
+    MAX_HASH_WORKERS: ClassVar[int] = 8
 
-    SUPPORTED_IMAGE_EXTENSIONS: ClassVar[set[str]] = {".jpg", ".png"}
+    # Concurrent tag readers used by the ``process_directory`` metadata pre-scan.
+    MAX_PRESCAN_WORKERS: ClassVar[int] = 4
+
+    # Concurrent romanization lookups. MusicBrainz requests stay spaced by the client's
+    # global rate limiter, but their round trips overlap.
+    ROMANIZER_WORKERS: ClassVar[int] = 4
 
     base_path: Path
     dry_run: bool
@@ -245,13 +317,25 @@ class MusicProcessor:
     before_dao: ProcessingBeforeDAO
     after_dao: ProcessingAfterDAO
     artist_dao: ArtistCacheDAO | _DryRunArtistCacheAdapter
+    hash_cache_dao: FileHashCacheDAO
     artist_name_preferences: ArtistNamePreferenceRepository
     artist_id_generator: CachedArtistIdGenerator
     directory_generator: DirectoryGenerator
     file_name_generator: FileNameGenerator
     _romanizer: ArtistRomanizer
     _romanizer_executor: ThreadPoolExecutor
-    _romanize_futures: dict[str, Future[str]]
+    _hash_executor: ThreadPoolExecutor
+    _romanize_futures: dict[str, Future[str] | str]
+    _unpersisted_preferences: set[str]
+    _known_romanizations: dict[str, str]
+    _ensured_directories: set[Path]
+    _vacated_directories: set[Path]
+    _metadata_cache: dict[Path, tuple[int, TrackMetadata]]
+    _defer_db_writes: bool
+    _pending_before: dict[str, Path]
+    _pending_after: dict[str, tuple[Path, Path]]
+    _directory_listings: dict[Path, _DirectoryListing] | None
+    _prefetched_targets: dict[str, Path | None]
 
     def __init__(self, base_path: Path, dry_run: bool = False) -> None:
         """Initialize music processor.
@@ -280,16 +364,27 @@ class MusicProcessor:
         # Initialize DAOs.
         self.before_dao = ProcessingBeforeDAO(conn)
         self.after_dao = ProcessingAfterDAO(conn)
-        base_artist_dao = ArtistCacheDAO(conn)
+        # Cache lookups go through a read-only connection so the romanizer thread does not
+        # wait on the writer.
+        read_conn = self.db_manager.get_reader_connection()
+        self.hash_cache_dao = FileHashCacheDAO(conn, read_conn)
+        base_artist_dao = ArtistCacheDAO(conn, read_conn)
         self.artist_dao = _DryRunArtistCacheAdapter(base_artist_dao) if self.dry_run else base_artist_dao
         configure_romanization_cache(self.artist_dao)
+        # Romanized names already read from the persistent cache, so each name costs at most
+        # one query; bulk lookups in ``_schedule_romanizations`` fill it for many names at once.
+        self._known_romanizations = {}
+
+        preference_lock = threading.Lock()
 
         def _fetch_with_persistent_cache(name: str) -> str | None:
             trimmed = name.strip()
             if not trimmed:
                 return None
 
-            self.artist_name_preferences.ensure_placeholder(trimmed)
+            # Placeholders rewrite the preference file, so romanizer threads take turns.
+            with preference_lock:
+                self.artist_name_preferences.ensure_placeholder(trimmed)
             preferred = self.artist_name_preferences.resolve(trimmed)
             if preferred is not None:
                 if hasattr(self, "_romanizer"):
@@ -305,17 +400,20 @@ class MusicProcessor:
                 )
                 return preferred
 
-            try:
-                cached = self.artist_dao.get_romanized_name(trimmed)
-            except Exception as exc:  # pragma: no cover - defensive logging
-                logger.warning(
-                    "Failed to consult persistent romanization cache for '%s': %s",
-                    trimmed,
-                    exc,
-                )
-                cached = None
+            cached = self._known_romanizations.get(trimmed)
+            if cached is None:
+                try:
+                    cached = self.artist_dao.get_romanized_name(trimmed)
+                except Exception as exc:  # pragma: no cover - defensive logging
+                    logger.warning(
+                        "Failed to consult persistent romanization cache for '%s': %s",
+                        trimmed,
+                        exc,
+                    )
+                    cached = None
 
             if cached:
+                self._known_romanizations[trimmed] = cached
                 if hasattr(self, "_romanizer"):
                     self._romanizer.record_fetch_context(
                         source="cache",
@@ -339,8 +437,32 @@ class MusicProcessor:
         self.file_name_generator = FileNameGenerator(self.artist_id_generator)
         self._romanizer = ArtistRomanizer(fetcher=_fetch_with_persistent_cache)
         MetadataExtractor.configure_romanizer(self._romanizer)
-        self._romanizer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mb-romanizer")
+        self._romanizer_executor = ThreadPoolExecutor(
+            max_workers=self.ROMANIZER_WORKERS,
+            thread_name_prefix="mb-romanizer",
+        )
+        # hashlib releases the GIL on large buffers, so files hash in parallel across cores.
+        self._hash_executor = ThreadPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, self.MAX_HASH_WORKERS),
+            thread_name_prefix="omym-hash",
+        )
         self._romanize_futures = {}
+        # Names whose user-preferred value has not yet been written to the artist cache.
+        self._unpersisted_preferences = set()
+        self._ensured_directories = set()
+        self._vacated_directories = set()
+        self._metadata_cache = {}
+        # processing_before/after rows keyed by file hash, written in bulk at commit time
+        # while ``process_directory`` runs; standalone ``process_file`` calls write through.
+        self._defer_db_writes = False
+        self._pending_before = {}
+        self._pending_after = {}
+        # Regular files per source folder, listed once per ``process_directory`` run so that
+        # sibling tracks share one scan for lyrics and artwork lookups.
+        self._directory_listings = None
+        # Recorded targets for hashes known before the run loop starts, looked up in one query;
+        # None marks a hash with no recorded target.
+        self._prefetched_targets = {}
 
     def _log_processing(
         self,
@@ -350,15 +472,16 @@ class MusicProcessor:
         *message_args: object,
         **context: Any,
     ) -> None:
-        """Emit a structured log entry for processing operations."""
+        """Emit a structured log entry for processing operations.
 
-        extra: dict[str, Any] = {"processing_event": event.value}
-        for key, value in context.items():
-            if isinstance(value, Path):
-                extra[key] = str(value)
-            else:
-                extra[key] = value
-        logger.log(level, message, *message_args, extra=extra, stacklevel=2)
+        Path values are attached to the record unchanged; handlers stringify them only
+        when they actually render the record.
+        """
+
+        if not logger.isEnabledFor(level):
+            return
+        context["processing_event"] = event.value
+        logger.log(level, message, *message_args, extra=context, stacklevel=2)
 
     def process_directory(
         self,
@@ -378,12 +501,37 @@ class MusicProcessor:
         if not directory.is_dir():
             raise ValueError(f"Not a directory: {directory}")
 
+        # Per-file logs are rendered on a listener thread so the processing loop does not
+        # wait on console and log file I/O.
+        with queued_log_handlers():
+            return self._process_directory(directory, progress_callback)
+
+    def _process_directory(
+        self,
+        directory: Path,
+        progress_callback: Callable[[int, int, Path], None] | None,
+    ) -> list[ProcessResult]:
+        """Process all supported files below ``directory``; see ``process_directory``."""
+
         process_id = uuid.uuid4().hex[:12]
         results: list[ProcessResult] = []
-        supported_files = [f for f in directory.rglob("*") if self._is_supported(f)]
+        # Directory cleanup at the end of a run may remove folders, so start each run fresh.
+        self._ensured_directories.clear()
+        self._vacated_directories.clear()
+        self._metadata_cache.clear()
+        self._directory_listings = {}
+        # Discovery also captures ``(size, mtime_ns)`` from each directory entry; Windows
+        # fills these from the directory listing itself, so no separate stat pass is needed.
+        file_stats: dict[Path, tuple[int, int]] = {}
+        supported_files: list[Path] = []
+        for supported_file, file_stat in self._iter_supported(directory):
+            supported_files.append(supported_file)
+            if file_stat is not None:
+                file_stats[supported_file] = file_stat
         total_files = len(supported_files)
 
         if total_files == 0:
+            self._directory_listings = None
             self._log_processing(
                 logging.WARNING,
                 ProcessingEvent.DIRECTORY_NO_FILES,
@@ -416,22 +564,57 @@ class MusicProcessor:
             source_base_path=directory,
         )
 
+        # Reuse digests of files whose size and mtime are unchanged since they were last hashed,
+        # and start hashing the rest up front; the sequential loop below only waits on results.
+        cached_hashes = self.hash_cache_dao.get_cached_hashes(file_stats)
+        hash_futures: dict[Path, Future[str]] = {
+            supported_file: self._hash_executor.submit(self._calculate_file_hash, supported_file)
+            for supported_file in supported_files
+            if supported_file not in cached_hashes
+        }
+        # Files whose digests came from the cache are checked against the processing history
+        # in bulk, so the loop below skips the per-file duplicate queries for them.
+        if cached_hashes:
+            known_targets = self.before_dao.get_target_paths(cached_hashes.values())
+            if known_targets is not None:
+                self._prefetched_targets = {
+                    cached_hash: known_targets.get(cached_hash)
+                    for cached_hash in cached_hashes.values()
+                }
+        # Cache rows are written from this thread only, since the connection is shared.
+        hash_cache_updates: list[tuple[Path, int, int, str]] = []
+
         # Pre-scan metadata to register album years across the whole directory.
         # This ensures the album-level earliest year is known before generating any paths,
         # avoiding transient splits like 2020_/2024_ for the same album based on processing order.
-        for pre_file in supported_files:
+        # Artist names are collected first so the romanization cache is consulted in bulk.
+        # Extracted metadata is cached by mtime so the main loop does not parse every file's
+        # tags twice. Tags are read on a small thread pool so file reads and romanization
+        # lookups overlap; results are registered here in file order.
+        with ThreadPoolExecutor(
+            max_workers=min(total_files, self.MAX_PRESCAN_WORKERS),
+            thread_name_prefix="omym-prescan",
+        ) as prescan_pool:
+            prescanned = list(prescan_pool.map(self._prescan_metadata, supported_files))
+        artist_names: list[str] = []
+        for pre_file, meta in zip(supported_files, prescanned, strict=True):
+            if meta is None:
+                continue
             try:
-                meta = MetadataExtractor.extract(pre_file)
+                pre_stat = file_stats.get(pre_file)
+                if pre_stat is not None:
+                    self._metadata_cache[pre_file] = (pre_stat[1], meta)
                 if meta.artist:
-                    self._schedule_romanization(meta.artist)
+                    artist_names.append(meta.artist)
                 if meta.album_artist:
-                    self._schedule_romanization(meta.album_artist)
+                    artist_names.append(meta.album_artist)
                 self.directory_generator.register_album_year(meta)
                 # Register album-level track width for consistent padding
                 FileNameGenerator.register_album_track_width(meta)
             except Exception:
                 # Best-effort: failure to read one file's metadata must not block processing
                 continue
+        self._schedule_romanizations(artist_names)
 
         processed_count = 0
         conn = self.db_manager.conn
@@ -441,8 +624,20 @@ class MusicProcessor:
         try:
             if not self.dry_run:
                 _ = conn.execute("BEGIN TRANSACTION")
+                self._defer_db_writes = True
 
             for index, current_file in enumerate(supported_files, start=1):
+                precomputed_hash = cached_hashes.get(current_file)
+                if precomputed_hash is None:
+                    try:
+                        precomputed_hash = hash_futures.pop(current_file).result()
+                    except Exception:
+                        # Let process_file hash again and report the failure in context.
+                        precomputed_hash = None
+                    else:
+                        current_stat = file_stats.get(current_file)
+                        if current_stat is not None:
+                            hash_cache_updates.append((current_file, *current_stat, precomputed_hash))
                 try:
                     result = self.process_file(
                         current_file,
@@ -451,6 +646,7 @@ class MusicProcessor:
                         total=total_files,
                         source_root=directory,
                         target_root=self.base_path,
+                        precomputed_hash=precomputed_hash,
                     )
                 except Exception as exc:
                     error_message = str(exc) if str(exc) else type(exc).__name__
@@ -488,6 +684,17 @@ class MusicProcessor:
                 results.append(result)
                 processed_count += 1
 
+                # A moved file keeps its size and mtime, so its digest stays valid at the target.
+                moved_stat = file_stats.get(current_file)
+                if (
+                    result.success
+                    and result.file_hash
+                    and result.target_path is not None
+                    and result.target_path != current_file
+                    and moved_stat is not None
+                ):
+                    hash_cache_updates.append((result.target_path, *moved_stat, result.file_hash))
+
                 if result.success:
                     stats.record_success()
                 else:
@@ -497,9 +704,15 @@ class MusicProcessor:
                     progress_callback(processed_count, total_files, current_file)
 
             if not self.dry_run:
-                remove_empty_directories(directory)
+                # Only folders that files were moved out of can have become empty.
+                prune_empty_directories(self._vacated_directories, directory)
+                self._vacated_directories.clear()
+                self._ensured_directories.clear()
 
             if not self.dry_run:
+                self._flush_pending_writes()
+                if hash_cache_updates:
+                    _ = self.hash_cache_dao.upsert_hashes(hash_cache_updates)
                 conn.commit()
 
             summary_extra = stats.summary_extra()
@@ -560,6 +773,15 @@ class MusicProcessor:
                         directory=directory,
                         rollback_error=rollback_error,
                     ) from rollback_error
+        finally:
+            # Files left unprocessed after an error must not keep hashing in the background.
+            for pending in hash_futures.values():
+                _ = pending.cancel()
+            self._defer_db_writes = False
+            self._pending_before.clear()
+            self._pending_after.clear()
+            self._directory_listings = None
+            self._prefetched_targets = {}
 
         return results
 
@@ -572,14 +794,37 @@ class MusicProcessor:
         total: int | None = None,
         source_root: Path | None = None,
         target_root: Path | None = None,
+        precomputed_hash: str | None = None,
     ) -> ProcessResult:
-        """Process a single music file."""
+        """Process a single music file.
+
+        Args:
+            file_path: Music file to organize.
+            process_id: Optional identifier used to correlate log entries.
+            sequence: Optional sequence number for the file inside a batch.
+            total: Optional total number of files in the batch.
+            source_root: Optional source root used to abbreviate paths in logs.
+            target_root: Optional target root used to abbreviate paths in logs.
+            precomputed_hash: SHA-256 digest computed ahead of time by the caller; the
+                file is hashed here when omitted.
+
+        Returns:
+            ProcessResult describing the outcome.
+        """
 
         file_hash: str | None = None
         start_time = time.perf_counter()
         current_process_id = process_id or uuid.uuid4().hex[:12]
         effective_source_root = source_root or file_path.parent
         effective_target_root = target_root or self.base_path
+        # Fields shared by every log entry emitted for this file.
+        log_context: dict[str, Any] = {
+            "process_id": current_process_id,
+            "sequence": sequence,
+            "total_files": total,
+            "source_path": file_path,
+            "source_base_path": effective_source_root,
+        }
         warnings: list[str] = []
         lyrics_result: LyricsProcessingResult | None = None
         artwork_results: list[ArtworkProcessingResult] = []
@@ -594,7 +839,7 @@ class MusicProcessor:
 
         try:
             # Calculate file hash.
-            file_hash = self._calculate_file_hash(file_path)
+            file_hash = precomputed_hash or self._hash_with_cache(file_path)
             self._log_processing(
                 logging.DEBUG,
                 ProcessingEvent.FILE_START,
@@ -603,18 +848,17 @@ class MusicProcessor:
                 file_path.name,
                 file_hash,
                 self.dry_run,
-                process_id=current_process_id,
-                sequence=sequence,
-                total_files=total,
-                source_path=file_path,
-                source_base_path=effective_source_root,
+                **log_context,
                 file_hash=file_hash,
                 dry_run=self.dry_run,
             )
 
-            if self.before_dao.check_file_exists(file_hash):
-                target_raw = self.before_dao.get_target_path(file_hash)
-                target_path = Path(target_raw) if target_raw else None
+            pending_after = self._pending_after.get(file_hash)
+            if pending_after is not None:
+                target_path: Path | None = pending_after[1]
+            else:
+                target_path = self._processed_target(file_hash)
+            if pending_after is not None or target_path is not None:
                 if target_path and target_path.exists():
                     if associated_lyrics is not None:
                         lyrics_result = self._process_associated_lyrics(
@@ -660,11 +904,7 @@ class MusicProcessor:
                     current_process_id,
                     file_path.name,
                     target_display,
-                    process_id=current_process_id,
-                    sequence=sequence,
-                    total_files=total,
-                    source_path=file_path,
-                    source_base_path=effective_source_root,
+                    **log_context,
                     target_path=target_path,
                     target_base_path=effective_target_root,
                     file_hash=file_hash,
@@ -682,7 +922,7 @@ class MusicProcessor:
                 )
 
             # Extract metadata.
-            metadata = MetadataExtractor.extract(file_path)
+            metadata = self._get_metadata(file_path)
             if not metadata:
                 raise ValueError("Failed to extract metadata")
 
@@ -698,7 +938,7 @@ class MusicProcessor:
 
             # Save file state.
             if not self.dry_run:
-                if not self.before_dao.insert_file(file_hash, file_path):
+                if not self._record_before(file_hash, file_path):
                     raise ValueError("Failed to save file state to database")
 
             # If not in dry run mode, move the file and record updated state.
@@ -712,7 +952,7 @@ class MusicProcessor:
                     source_root=effective_source_root,
                     target_root=effective_target_root,
                 )
-                if not self.after_dao.insert_file(file_hash, file_path, target_path):
+                if not self._record_after(file_hash, file_path, target_path):
                     raise ValueError("Failed to save file state to database")
 
             if associated_lyrics is not None:
@@ -749,11 +989,7 @@ class MusicProcessor:
                 file_path.name,
                 target_path,
                 duration_ms,
-                process_id=current_process_id,
-                sequence=sequence,
-                total_files=total,
-                source_path=file_path,
-                source_base_path=effective_source_root,
+                **log_context,
                 target_path=target_path,
                 target_base_path=effective_target_root,
                 file_hash=file_hash,
@@ -778,103 +1014,299 @@ class MusicProcessor:
 
         except Exception as exc:
             error_message = str(exc) if str(exc) else type(exc).__name__
-            duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
-            self._log_processing(
-                logging.ERROR,
-                ProcessingEvent.FILE_ERROR,
-                "Error processing file [id=%s, name=%s, error=%s, duration_ms=%.2f]",
-                current_process_id,
-                file_path.name,
+            return self._emit_failure(
+                log_context,
                 error_message,
-                duration_ms,
-                process_id=current_process_id,
-                sequence=sequence,
-                total_files=total,
-                source_path=file_path,
-                source_base_path=effective_source_root,
-                file_hash=file_hash,
-                error_message=error_message,
-                duration_ms=duration_ms,
-                dry_run=self.dry_run,
-            )
-            return ProcessResult(
-                source_path=file_path,
-                success=False,
-                error_message=error_message,
-                dry_run=self.dry_run,
+                start_time=start_time,
                 file_hash=file_hash,
                 artwork_results=artwork_results,
                 warnings=warnings,
             )
 
-    def _is_supported(self, file: Path) -> bool:
-        """Check if the given file has a supported extension.
+    def _emit_failure(
+        self,
+        log_context: dict[str, Any],
+        error_message: str,
+        *,
+        start_time: float,
+        file_hash: str | None,
+        artwork_results: list[ArtworkProcessingResult],
+        warnings: list[str],
+    ) -> ProcessResult:
+        """Log a failed file and build its result.
 
         Args:
-            file: File path to check.
+            log_context: Per-file log fields built by ``process_file``.
+            error_message: Description of the failure.
+            start_time: ``time.perf_counter()`` value taken when the file was started.
+            file_hash: Hash of the file, if it was computed before the failure.
+            artwork_results: Artwork outcomes collected before the failure.
+            warnings: Warnings collected before the failure.
 
         Returns:
-            True if file is supported; otherwise, False.
+            ProcessResult describing the failure.
         """
-        return file.is_file() and file.suffix.lower() in self.SUPPORTED_EXTENSIONS
 
-    def _find_associated_lyrics(self, file_path: Path) -> tuple[Path | None, list[str]]:
-        """Locate an .lrc file that shares the same stem as the given music file."""
+        file_path: Path = log_context["source_path"]
+        duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+        self._log_processing(
+            logging.ERROR,
+            ProcessingEvent.FILE_ERROR,
+            "Error processing file [id=%s, name=%s, error=%s, duration_ms=%.2f]",
+            log_context["process_id"],
+            file_path.name,
+            error_message,
+            duration_ms,
+            **log_context,
+            file_hash=file_hash,
+            error_message=error_message,
+            duration_ms=duration_ms,
+            dry_run=self.dry_run,
+        )
+        return ProcessResult(
+            source_path=file_path,
+            success=False,
+            error_message=error_message,
+            dry_run=self.dry_run,
+            file_hash=file_hash,
+            artwork_results=artwork_results,
+            warnings=warnings,
+        )
 
-        parent = file_path.parent
-        warnings: list[str] = []
+    def _processed_target(self, file_hash: str) -> Path | None:
+        """Return where an earlier run put this file, if that copy still exists.
 
-        if not parent.exists():
-            return None, warnings
+        Args:
+            file_hash: Hash of the file being processed.
+
+        Returns:
+            Target path of the organized copy, or None if the file still needs processing.
+        """
+        if file_hash in self._prefetched_targets:
+            target_path = self._prefetched_targets[file_hash]
+            return target_path if target_path is not None and target_path.exists() else None
+        if not self.before_dao.check_file_exists(file_hash):
+            return None
+        target_raw = self.before_dao.get_target_path(file_hash)
+        return Path(target_raw) if target_raw else None
+
+    @staticmethod
+    def _prescan_metadata(file_path: Path) -> TrackMetadata | None:
+        """Extract metadata for the directory pre-scan, or None if the file cannot be read."""
 
         try:
-            candidates = [
-                candidate
-                for candidate in parent.iterdir()
-                if candidate.is_file()
-                and candidate.stem == file_path.stem
-                and candidate.suffix.lower() == ".lrc"
-            ]
+            return MetadataExtractor.extract(file_path)
+        except Exception:
+            # Best-effort: failure to read one file's metadata must not block processing
+            return None
+
+    def _hash_with_cache(self, file_path: Path) -> str:
+        """Return the digest of ``file_path``, skipping the read when the hash cache matches.
+
+        Known files, including duplicates of already organized tracks, are then recognized
+        from their size and mtime alone.
+
+        Args:
+            file_path: File to hash.
+
+        Returns:
+            Hex-encoded SHA-256 digest.
+        """
+        file_stat = self._stat_files((file_path,)).get(file_path)
+        if file_stat is not None:
+            cached = self.hash_cache_dao.get_cached_hashes({file_path: file_stat}).get(file_path)
+            if cached is not None:
+                return cached
+
+        file_hash = self._calculate_file_hash(file_path)
+        if file_stat is not None and not self.dry_run:
+            _ = self.hash_cache_dao.upsert_hashes([(file_path, *file_stat, file_hash)])
+        return file_hash
+
+    def _record_before(self, file_hash: str, file_path: Path) -> bool:
+        """Store the pre-move state of a file, deferring the write during directory runs."""
+
+        if self._defer_db_writes:
+            self._pending_before[file_hash] = file_path
+            return True
+        return self.before_dao.insert_file(file_hash, file_path)
+
+    def _record_after(self, file_hash: str, file_path: Path, target_path: Path) -> bool:
+        """Store the post-move state of a file, deferring the write during directory runs."""
+
+        if self._defer_db_writes:
+            self._pending_after[file_hash] = (file_path, target_path)
+            return True
+        return self.after_dao.insert_file(file_hash, file_path, target_path)
+
+    def _flush_pending_writes(self) -> None:
+        """Write deferred processing rows with one ``executemany`` per table.
+
+        Raises:
+            ValueError: If either table rejects the batch.
+        """
+        before_rows = list(self._pending_before.items())
+        if before_rows and not self.before_dao.insert_many(before_rows):
+            raise ValueError("Failed to save file state to database")
+        after_rows = [
+            (file_hash, file_path, target_path)
+            for file_hash, (file_path, target_path) in self._pending_after.items()
+        ]
+        if after_rows and not self.after_dao.insert_many(after_rows):
+            raise ValueError("Failed to save file state to database")
+        self._pending_before.clear()
+        self._pending_after.clear()
+
+    def _get_metadata(self, file_path: Path) -> TrackMetadata:
+        """Return metadata for ``file_path``, reusing the directory pre-scan when still valid.
+
+        Cached entries are consumed on use because processing rewrites artist fields in place.
+
+        Args:
+            file_path: Music file to read tags from.
+
+        Returns:
+            Extracted track metadata.
+        """
+        cached = self._metadata_cache.pop(file_path, None)
+        if cached is not None:
+            try:
+                mtime_ns = os.stat(file_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if mtime_ns == cached[0]:
+                return cached[1]
+        return MetadataExtractor.extract(file_path)
+
+    @staticmethod
+    def _stat_files(files: Iterable[Path]) -> dict[Path, tuple[int, int]]:
+        """Return ``(size, mtime_ns)`` for each readable file, used to validate cached hashes."""
+
+        file_stats: dict[Path, tuple[int, int]] = {}
+        for file in files:
+            try:
+                stat_result = os.stat(file)
+            except OSError:
+                continue
+            file_stats[file] = (stat_result.st_size, stat_result.st_mtime_ns)
+        return file_stats
+
+    def _iter_supported(self, root: Path) -> Iterator[tuple[Path, tuple[int, int] | None]]:
+        """Yield supported music files below ``root`` with their size and mtime.
+
+        Walks the tree with ``os.scandir`` so file/directory checks reuse the type cached
+        in each directory entry, and only builds ``Path`` objects for matching files.
+        Symlinked directories are not descended into, matching ``Path.rglob``.
+
+        Args:
+            root: Directory to search recursively.
+
+        Yields:
+            Each file with a supported extension and its ``(size, mtime_ns)``, or None
+            when the file cannot be stat'ed.
+        """
+        pending = [os.fspath(root)]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif (
+                                entry.name.lower().endswith(self._SUPPORTED_SUFFIXES)
+                                and entry.is_file()
+                            ):
+                                try:
+                                    stat_result = entry.stat()
+                                except OSError:
+                                    yield Path(entry.path), None
+                                else:
+                                    yield Path(entry.path), (
+                                        stat_result.st_size,
+                                        stat_result.st_mtime_ns,
+                                    )
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+    def _scan_directory(self, directory: Path) -> _DirectoryListing:
+        """Return the tracks, artwork and lyrics files directly inside ``directory``.
+
+        Entries are classified in a single ``os.scandir`` pass and each group is sorted
+        once. During ``process_directory`` the listing is reused for every sibling track,
+        so it reflects the folder as it was before any of its files were moved.
+
+        Args:
+            directory: Folder to scan.
+
+        Returns:
+            Partitioned listing; empty if the folder cannot be read.
+        """
+        listings = self._directory_listings
+        if listings is not None:
+            cached = listings.get(directory)
+            if cached is not None:
+                return cached
+
+        tracks: list[Path] = []
+        artworks: list[Path] = []
+        lyrics_by_stem: dict[str, list[Path]] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    lowered = entry.name.lower()
+                    if lowered.endswith(self._SUPPORTED_SUFFIXES):
+                        bucket = tracks
+                    elif lowered.endswith(self._SUPPORTED_IMAGE_SUFFIXES):
+                        bucket = artworks
+                    elif lowered.endswith(".lrc") and len(entry.name) > len(".lrc"):
+                        bucket = lyrics_by_stem.setdefault(entry.name[: -len(".lrc")], [])
+                    else:
+                        continue
+                    if entry.is_file():
+                        bucket.append(Path(entry.path))
+            listing = _DirectoryListing(
+                tracks=tuple(sorted(tracks)),
+                artworks=tuple(sorted(artworks)),
+                lyrics_by_stem={
+                    stem: tuple(sorted(paths)) for stem, paths in lyrics_by_stem.items() if paths
+                },
+            )
         except OSError:
-            return None, warnings
+            listing = _DirectoryListing()
+
+        if listings is not None:
+            listings[directory] = listing
+        return listing
+
+    def _find_associated_lyrics(self, file_path: Path) -> tuple[Path | None, list[str]]:
+        """Locate an .lrc file that shares the same stem as the given music file."""
+
+        warnings: list[str] = []
 
+        candidates = self._scan_directory(file_path.parent).lyrics_by_stem.get(file_path.stem)
         if not candidates:
             return None, warnings
 
-        candidates.sort()
+        selected = candidates[0]
         if len(candidates) > 1:
             warnings.append(
-                f"Multiple lyrics files found for {file_path.name}; using {candidates[0].name}"
+                f"Multiple lyrics files found for {file_path.name}; using {selected.name}"
             )
 
-        return candidates[0], warnings
+        return selected, warnings
 
     def _resolve_directory_artwork(self, file_path: Path) -> tuple[list[Path], bool]:
         """Resolve artwork files in the same directory if the track is primary."""
 
-        parent = file_path.parent
-        if not parent.exists():
+        listing = self._scan_directory(file_path.parent)
+        if not listing.tracks or listing.tracks[0] != file_path:
             return [], False
 
-        try:
-            entries = [candidate for candidate in parent.iterdir() if candidate.is_file()]
-        except OSError:
-            return [], False
-
-        supported_tracks = sorted(
-            entry
-            for entry in entries
-            if entry.suffix.lower() in self.SUPPORTED_EXTENSIONS
-        )
-        if not supported_tracks or supported_tracks[0] != file_path:
-            return [], False
-
-        artworks = sorted(
-            entry
-            for entry in entries
-            if entry.suffix.lower() in self.SUPPORTED_IMAGE_EXTENSIONS
-        )
-        return artworks, True
+        return list(listing.artworks), True
 
     def _process_associated_lyrics(
         self,
@@ -890,6 +1322,16 @@ class MusicProcessor:
         """Move a lyrics file so that it matches the target music file path."""
 
         target_lyrics_path = target_file_path.with_suffix(".lrc")
+        # Fields shared by every log entry emitted for this lyrics file.
+        log_context: dict[str, Any] = {
+            "process_id": process_id,
+            "sequence": sequence,
+            "total_files": total,
+            "source_path": lyrics_path,
+            "source_base_path": source_root,
+            "target_path": target_lyrics_path,
+            "target_base_path": target_root,
+        }
 
         if not lyrics_path.exists():
             self._log_processing(
@@ -898,13 +1340,7 @@ class MusicProcessor:
                 "Lyrics file missing before move [id=%s, src=%s]",
                 process_id,
                 lyrics_path,
-                process_id=process_id,
-                sequence=sequence,
-                total_files=total,
-                source_path=lyrics_path,
-                source_base_path=source_root,
-                target_path=target_lyrics_path,
-                target_base_path=target_root,
+                **log_context,
                 error_message="lyrics_source_missing",
             )
             return LyricsProcessingResult(
@@ -923,13 +1359,7 @@ class MusicProcessor:
                 process_id,
                 lyrics_path,
                 target_lyrics_path,
-                process_id=process_id,
-                sequence=sequence,
-                total_files=total,
-                source_path=lyrics_path,
-                source_base_path=source_root,
-                target_path=target_lyrics_path,
-                target_base_path=target_root,
+                **log_context,
             )
             return LyricsProcessingResult(
                 source_path=lyrics_path,
@@ -947,13 +1377,7 @@ class MusicProcessor:
                 process_id,
                 lyrics_path,
                 target_lyrics_path,
-                process_id=process_id,
-                sequence=sequence,
-                total_files=total,
-                source_path=lyrics_path,
-                source_base_path=source_root,
-                target_path=target_lyrics_path,
-                target_base_path=target_root,
+                **log_context,
                 dry_run=self.dry_run,
             )
             return LyricsProcessingResult(
@@ -964,8 +1388,9 @@ class MusicProcessor:
             )
 
         try:
-            _ = ensure_parent_directory(target_lyrics_path)
-            _ = shutil.move(str(lyrics_path), str(target_lyrics_path))
+            self._ensure_parent_directory(target_lyrics_path)
+            move_file(lyrics_path, target_lyrics_path)
+            self._vacated_directories.add(lyrics_path.parent)
         except Exception as exc:  # pragma: no cover - defensive logging of unexpected failure
             error_message = str(exc) if str(exc) else type(exc).__name__
             self._log_processing(
@@ -976,13 +1401,7 @@ class MusicProcessor:
                 lyrics_path,
                 target_lyrics_path,
                 error_message,
-                process_id=process_id,
-                sequence=sequence,
-                total_files=total,
-                source_path=lyrics_path,
-                source_base_path=source_root,
-                target_path=target_lyrics_path,
-                target_base_path=target_root,
+                **log_context,
                 error_message=error_message,
             )
             return LyricsProcessingResult(
@@ -1000,13 +1419,7 @@ class MusicProcessor:
             process_id,
             lyrics_path,
             target_lyrics_path,
-            process_id=process_id,
-            sequence=sequence,
-            total_files=total,
-            source_path=lyrics_path,
-            source_base_path=source_root,
-            target_path=target_lyrics_path,
-            target_base_path=target_root,
+            **log_context,
         )
         return LyricsProcessingResult(
             source_path=lyrics_path,
@@ -1119,37 +1532,45 @@ class MusicProcessor:
                 )
                 continue
 
+            # Compare device and inode directly: one stat per side instead of resolving every
+            # path component, and a missing destination (the common case) fails fast.
             try:
-                if artwork_path.resolve() == target_artwork_path.resolve():
-                    self._log_processing(
-                        logging.INFO,
-                        ProcessingEvent.ARTWORK_SKIP_ALREADY_AT_TARGET,
-                        "Artwork already at target [id=%s, path=%s]",
-                        process_id,
-                        artwork_path,
-                        process_id=process_id,
-                        sequence=sequence,
-                        total_files=total,
+                source_stat = os.stat(artwork_path)
+                target_stat = os.stat(target_artwork_path)
+            except OSError:
+                already_at_target = False
+            else:
+                already_at_target = (source_stat.st_dev, source_stat.st_ino) == (
+                    target_stat.st_dev,
+                    target_stat.st_ino,
+                )
+            if already_at_target:
+                self._log_processing(
+                    logging.INFO,
+                    ProcessingEvent.ARTWORK_SKIP_ALREADY_AT_TARGET,
+                    "Artwork already at target [id=%s, path=%s]",
+                    process_id,
+                    artwork_path,
+                    process_id=process_id,
+                    sequence=sequence,
+                    total_files=total,
+                    source_path=artwork_path,
+                    source_base_path=source_root,
+                    target_path=target_artwork_path,
+                    target_base_path=target_root,
+                    linked_track_path=target_track_path,
+                )
+                results.append(
+                    ArtworkProcessingResult(
                         source_path=artwork_path,
-                        source_base_path=source_root,
                         target_path=target_artwork_path,
-                        target_base_path=target_root,
-                        linked_track_path=target_track_path,
-                    )
-                    results.append(
-                        ArtworkProcessingResult(
-                            source_path=artwork_path,
-                            target_path=target_artwork_path,
-                            linked_track=target_track_path,
-                            moved=False,
-                            dry_run=self.dry_run,
-                            reason="already_at_target",
-                        )
+                        linked_track=target_track_path,
+                        moved=False,
+                        dry_run=self.dry_run,
+                        reason="already_at_target",
                     )
-                    continue
-            except OSError:
-                # If resolve fails (e.g., due to permissions), continue with move handling.
-                pass
+                )
+                continue
 
             if self.dry_run:
                 self._log_processing(
@@ -1181,8 +1602,9 @@ class MusicProcessor:
                 continue
 
             try:
-                _ = ensure_parent_directory(target_artwork_path)
-                _ = shutil.move(str(artwork_path), str(target_artwork_path))
+                self._ensure_parent_directory(target_artwork_path)
+                move_file(artwork_path, target_artwork_path)
+                self._vacated_directories.add(artwork_path.parent)
             except Exception as exc:
                 error_message = str(exc) if str(exc) else type(exc).__name__
                 self._log_processing(
@@ -1260,12 +1682,8 @@ class MusicProcessor:
             ]
 
         if not result.moved:
-            reason_map = {
-                "target_exists": "target already exists",
-                "lyrics_source_missing": "source lyrics missing",
-            }
             reason = result.reason or "unknown reason"
-            friendly_reason = reason_map.get(reason, reason)
+            friendly_reason = _LYRICS_REASON_MESSAGES.get(reason, reason)
             return [
                 f"Lyrics file {result.source_path.name} not moved: {friendly_reason}"
             ]
@@ -1279,7 +1697,10 @@ class MusicProcessor:
 
         warnings: list[str] = []
         for result in results:
-            if result.dry_run and not result.moved:
+            if result.moved:
+                continue
+
+            if result.dry_run:
                 warnings.append(
                     (
                         "Dry run: artwork "
@@ -1288,18 +1709,9 @@ class MusicProcessor:
                 )
                 continue
 
-            if not result.moved:
-                reason_map = {
-                    "target_exists": "target already exists",
-                    "source_missing": "source artwork missing",
-                    "already_at_target": "already at destination",
-                    "no_target_track": "target track unavailable",
-                }
-                reason = result.reason or "unknown reason"
-                friendly_reason = reason_map.get(reason, reason)
-                warnings.append(
-                    f"Artwork file {result.source_path.name} not moved: {friendly_reason}"
-                )
+            reason = result.reason or "unknown reason"
+            friendly_reason = _ARTWORK_REASON_MESSAGES.get(reason, reason)
+            warnings.append(f"Artwork file {result.source_path.name} not moved: {friendly_reason}")
 
         return warnings
 
@@ -1326,23 +1738,41 @@ class MusicProcessor:
             target_root: Optional root directory used to abbreviate target paths in logs.
         """
 
-        _ = ensure_parent_directory(dest_path)
-        self._log_processing(
-            logging.INFO,
-            ProcessingEvent.FILE_MOVE,
-            "Moving file [id=%s, src=%s, dest=%s]",
-            process_id or "-",
-            src_path,
-            dest_path,
-            process_id=process_id,
-            sequence=sequence,
-            total_files=total,
-            source_path=src_path,
-            source_base_path=source_root or src_path.parent,
-            target_path=dest_path,
-            target_base_path=target_root or dest_path.parent,
-        )
-        _ = shutil.move(str(src_path), str(dest_path))
+        self._ensure_parent_directory(dest_path)
+        # Runs once per moved track; skip building the structured context when INFO is off.
+        if logger.isEnabledFor(logging.INFO):
+            self._log_processing(
+                logging.INFO,
+                ProcessingEvent.FILE_MOVE,
+                "Moving file [id=%s, src=%s, dest=%s]",
+                process_id or "-",
+                src_path,
+                dest_path,
+                process_id=process_id,
+                sequence=sequence,
+                total_files=total,
+                source_path=src_path,
+                source_base_path=source_root or src_path.parent,
+                target_path=dest_path,
+                target_base_path=target_root or dest_path.parent,
+            )
+        move_file(src_path, dest_path)
+        self._vacated_directories.add(src_path.parent)
+
+    def _ensure_parent_directory(self, path: Path) -> None:
+        """Create the parent directory of ``path`` once per run.
+
+        Many tracks share an album folder, so remembering which parents already exist
+        turns one mkdir attempt per file into one per destination directory.
+
+        Args:
+            path: File path whose parent directory must exist.
+        """
+        parent = path.parent
+        if parent in self._ensured_directories:
+            return
+        _ = ensure_parent_directory(path)
+        self._ensured_directories.add(parent)
 
     def _generate_target_path(
         self,
@@ -1382,11 +1812,11 @@ class MusicProcessor:
         if trimmed in self._romanize_futures:
             return
 
+        # Values known synchronously are stored as plain strings; only pending lookups get a Future.
         preferred = self.artist_name_preferences.resolve(trimmed)
         if preferred is not None:
-            preferred_future: Future[str] = Future()
-            preferred_future.set_result(preferred)
-            self._romanize_futures[trimmed] = preferred_future
+            self._romanize_futures[trimmed] = preferred
+            self._unpersisted_preferences.add(trimmed)
             logger.debug(
                 "Using artist name preference for '%s' during scheduling", trimmed
             )
@@ -1400,11 +1830,51 @@ class MusicProcessor:
 
         if cached_value:
             logger.debug("Using persisted romanization cache for '%s'", trimmed)
-            cached_future: Future[str] = Future()
-            cached_future.set_result(cached_value)
-            self._romanize_futures[trimmed] = cached_future
+            self._romanize_futures[trimmed] = cached_value
             return
 
+        self._submit_romanization(trimmed)
+
+    def _schedule_romanizations(self, names: Iterable[str]) -> None:
+        """Schedule romanization for many names with a single cache query.
+
+        Args:
+            names: Artist names gathered from a directory pre-scan.
+        """
+        pending: list[str] = []
+        seen: set[str] = set()
+        for name in names:
+            trimmed = name.strip()
+            if not trimmed or trimmed in seen or trimmed in self._romanize_futures:
+                continue
+            seen.add(trimmed)
+            preferred = self.artist_name_preferences.resolve(trimmed)
+            if preferred is not None:
+                self._romanize_futures[trimmed] = preferred
+                self._unpersisted_preferences.add(trimmed)
+                continue
+            pending.append(trimmed)
+
+        if not pending:
+            return
+
+        cached_values: dict[str, str] = {}
+        try:
+            cached_values = self.artist_dao.get_romanized_names(pending)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.warning("Failed to read cached romanized names in bulk: %s", exc)
+        self._known_romanizations.update(cached_values)
+
+        for trimmed in pending:
+            cached_value = cached_values.get(trimmed)
+            if cached_value:
+                self._romanize_futures[trimmed] = cached_value
+            else:
+                self._submit_romanization(trimmed)
+
+    def _submit_romanization(self, trimmed: str) -> None:
+        """Queue a background romanization task for a name missing from every cache."""
+
         def _romanize() -> str:
             return self._romanizer.romanize_name(trimmed) or trimmed
 
@@ -1415,16 +1885,23 @@ class MusicProcessor:
         trimmed = name.strip()
         if not trimmed:
             return name
-        future = self._romanize_futures.get(trimmed)
-        if future is None:
+        entry = self._romanize_futures.get(trimmed)
+        if entry is None:
             self._schedule_romanization(trimmed)
-            future = self._romanize_futures.get(trimmed)
-        if future is None:
-            return name
+            entry = self._romanize_futures[trimmed]
+        if isinstance(entry, str):
+            # Preferred names are persisted once, on first use; values read from the cache or
+            # already written by an earlier track need no further write.
+            if trimmed in self._unpersisted_preferences:
+                self._unpersisted_preferences.discard(trimmed)
+                if entry != trimmed:
+                    _ = self.artist_dao.upsert_romanized_name(trimmed, entry)
+            return entry
         try:
-            romanized = future.result()
+            romanized = entry.result()
             if romanized != trimmed:
                 _ = self.artist_dao.upsert_romanized_name(trimmed, romanized)
+            self._romanize_futures[trimmed] = romanized
             return romanized
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.warning("Romanization future failed for '%s': %s", trimmed, exc)
@@ -1439,11 +1916,29 @@ class MusicProcessor:
         Returns:
             Hexadecimal hash string.
         """
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        with open(file_path, "rb", buffering=0) as f:
+            descriptor = f.fileno()
+            if os.fstat(descriptor).st_size >= self.MMAP_THRESHOLD:
+                # Large lossless files are hashed straight from the page cache without
+                # copying every chunk into Python-owned buffers.
+                with mmap.mmap(descriptor, 0, access=mmap.ACCESS_READ) as mapped:
+                    return hashlib.sha256(mapped).hexdigest()
+            if _HAS_POSIX_FADVISE:
+                # Hint sequential access so the kernel reads ahead while we hash.
+                try:
+                    os.posix_fadvise(descriptor, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            return self._hash_stream(f)
+
+    @staticmethod
+    def _hash_stream(stream: io.BufferedIOBase | io.FileIO) -> str:
+        """Return the SHA-256 hex digest of the remaining bytes in ``stream``.
+
+        ``hashlib.file_digest`` drives the read loop in C without per-chunk bytecode.
+        """
+
+        return hashlib.file_digest(stream, "sha256").hexdigest()
 
     def _find_available_path(
         self,
@@ -1476,10 +1971,39 @@ class MusicProcessor:
         parent = target_path.parent
         stem = target_path.stem
         extension = target_path.suffix
+        prefix = f"{stem} ("
+        suffix = f"){extension}"
+
+        # Snapshot the numbered siblings once so most probes are an int set lookup instead of a
+        # stat call. Names are compared casefolded so the hint also holds on case-insensitive
+        # volumes; the chosen candidate is still confirmed with exists() below, because the
+        # rename that follows would silently replace a file that appeared after the scan.
+        folded_prefix = prefix.casefold()
+        folded_suffix = suffix.casefold()
+        taken_counters: set[int] = set()
+        try:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    name = entry.name.casefold()
+                    if name.startswith(folded_prefix) and name.endswith(folded_suffix):
+                        number = name[len(folded_prefix) : len(name) - len(folded_suffix)]
+                        # Only canonical spellings ("2", not "02") collide with generated names.
+                        if number.isascii() and number.isdigit() and not number.startswith("0"):
+                            taken_counters.add(int(number))
+        except OSError:
+            # Without a listing, probe candidates one stat call at a time.
+            counter = 1
+            while (candidate := target_path.with_name(f"{prefix}{counter}{suffix}")).exists():
+                counter += 1
+            return candidate
+
+        # Skip counters the snapshot marks as taken, then confirm the candidate on disk so the
+        # filesystem's own name rules have the final say.
         counter = 1
-
         while True:
-            candidate = parent / f"{stem} ({counter}){extension}"
+            while counter in taken_counters:
+                counter += 1
+            candidate = target_path.with_name(f"{prefix}{counter}{suffix}")
             if not candidate.exists():
                 return candidate
             counter += 1
@@ -54,9 +54,11 @@ def parse_slash_separated(value: str) -> tuple[int | None, int | None]:
 
     Returns a tuple (number, total) or (None, None) if conversion fails.
     """
-    parts: list[str] = value.split(sep="/") if value else []
-    num: int | None = int(parts[0]) if parts and parts[0].isdigit() else None
-    total: int | None = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else None
+    # partition avoids building a list; anything after a second slash is ignored, as before.
+    head, _, rest = value.partition("/")
+    total_str, _, _ = rest.partition("/")
+    num: int | None = int(head) if head.isdigit() else None
+    total: int | None = int(total_str) if total_str.isdigit() else None
     return num, total
 
 
@@ -72,7 +74,8 @@ def parse_tuple_numbers(data: list[tuple[int, int]] | None) -> tuple[int | None,
 
 def parse_year(date_str: str) -> int | None:
     """Parse a year from a string (expects the first 4 characters to be digits)."""
-    return int(date_str[:4]) if date_str and len(date_str) >= 4 and date_str[:4].isdigit() else None
+    year_str = date_str[:4]
+    return int(year_str) if len(year_str) == 4 and year_str.isdigit() else None
 
 
 def safe_get_dsf(tags: TagsDict, key: str, default: str = "") -> str:
@@ -202,33 +205,39 @@ class BaseAudioExtractor(AudioFormatExtractor, abc.ABC):
         """
         try:
             tags: MutagenTags = self._open_file(file_path)
-            logger.debug("Opened file %s with tags type: %s", file_path, type(tags))
+            mapping = self.TAG_MAPPING
+            get_tag = self._get_tag_value
 
             # Extract basic metadata
-            title: str | None = self._get_tag_value(tags, key=self.TAG_MAPPING["title"])
-            logger.debug("Title tag: %s", title)
-            artist: str | None = self._get_tag_value(tags, key=self.TAG_MAPPING["artist"])
-            logger.debug("Artist tag: %s", artist)
-            album_artist: str | None = self._get_tag_value(tags, key=self.TAG_MAPPING["album_artist"])
-            logger.debug("Album artist tag: %s", album_artist)
-            album: str | None = self._get_tag_value(tags, key=self.TAG_MAPPING["album"])
-            logger.debug("Album tag: %s", album)
-
-            # Track information
-            track_str: str = self._get_tag_value(tags, key=self.TAG_MAPPING["track"]) or ""
-            logger.debug("Track tag: %s", track_str)
+            title: str | None = get_tag(tags, key=mapping["title"])
+            artist: str | None = get_tag(tags, key=mapping["artist"])
+            album_artist: str | None = get_tag(tags, key=mapping["album_artist"])
+            album: str | None = get_tag(tags, key=mapping["album"])
+
+            # Track and disc information
+            track_str: str = get_tag(tags, key=mapping["track"]) or ""
+            disc_str: str = get_tag(tags, key=mapping["disc"]) or ""
             track_number, track_total = parse_slash_separated(value=track_str)
-
-            # Disc information
-            disc_str: str = self._get_tag_value(tags, key=self.TAG_MAPPING["disc"]) or ""
-            logger.debug("Disc tag: %s", disc_str)
             disc_number, disc_total = parse_slash_separated(value=disc_str)
 
             # Year/Date information (prefer 'year' over 'date')
             # Some tag formats store a dedicated 'year' field; if present, prefer it.
-            year_str_preferred: str = self._get_tag_value(tags, key="year") or ""
-            date_str: str = self._get_tag_value(tags, key=self.TAG_MAPPING["date"]) or ""
-            logger.debug("Year tag: %s; Date tag: %s", year_str_preferred, date_str)
+            year_str_preferred: str = get_tag(tags, key="year") or ""
+            date_str: str = get_tag(tags, key=mapping["date"]) or ""
+            # One record per file instead of one per tag keeps the per-file cost down.
+            logger.debug(
+                "Read tags from %s [type=%s, title=%s, artist=%s, album_artist=%s, album=%s, track=%s, disc=%s, year=%s, date=%s]",
+                file_path,
+                type(tags),
+                title,
+                artist,
+                album_artist,
+                album,
+                track_str,
+                disc_str,
+                year_str_preferred,
+                date_str,
+            )
             year: int | None = parse_year(year_str_preferred) or parse_year(date_str)
 
             metadata: TrackMetadata = TrackMetadata(
@@ -391,6 +400,15 @@ class MetadataExtractor:
         ".opus": OpusExtractor(),
     }
 
+    # Per-format wrapper names, resolved with getattr on each call so patched wrappers apply.
+    _extract_method_names: ClassVar[dict[str, str]] = {
+        ".mp3": "_extract_mp3",
+        ".flac": "_extract_flac",
+        ".m4a": "_extract_m4a",
+        ".dsf": "_extract_dsf",
+        ".opus": "_extract_opus",
+    }
+
     # Compatibility wrappers for tests and external patching
     @classmethod
     def _extract_mp3(cls, file_path: Path) -> TrackMetadata:
@@ -437,18 +455,12 @@ class MetadataExtractor:
             Exception: If extraction fails.
         """
         ext: str = file_path.suffix.lower()
-        if ext not in cls.SUPPORTED_FORMATS:
+        method_name = cls._extract_method_names.get(ext)
+        if method_name is None:
             raise ValueError(f"Unsupported file format: {ext}")
 
         # Route through per-format methods to allow easy mocking in tests
-        method_map: dict[str, Callable[[Path], TrackMetadata]] = {
-            ".mp3": cls._extract_mp3,
-            ".flac": cls._extract_flac,
-            ".m4a": cls._extract_m4a,
-            ".dsf": cls._extract_dsf,
-            ".opus": cls._extract_opus,
-        }
-
-        metadata = method_map[ext](file_path)
+        extract_method: Callable[[Path], TrackMetadata] = getattr(cls, method_name)
+        metadata = extract_method(file_path)
         processed = cls._artist_romanizer.romanize_metadata(metadata)
         return processed if processed is not None else metadata
@@ -1,10 +1,11 @@
 """Album management system for organizing music files."""
 
+from collections.abc import Iterable, Mapping
 from sqlite3 import Connection
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import final
 
-from omym.infra.db.daos.albums_dao import AlbumDAO, AlbumInfo
+from omym.infra.db.daos.albums_dao import AlbumDAO, AlbumInfo, evaluate_track_continuity
 
 
 @dataclass
@@ -12,16 +13,47 @@ class AlbumGroup:
     """Album group information."""
 
     album_info: AlbumInfo
-    file_hashes: set[str]
+    file_hashes: list[str]
     warnings: list[str]
 
 
+def _parse_int(value: str | None) -> int | None:
+    """Parse an integer tag value without raising.
+
+    Args:
+        value: Raw tag value.
+
+    Returns:
+        int | None: Parsed integer, or None if the value is empty or not an integer.
+    """
+    if not value:
+        return None
+    text = value.strip()
+    digits = text[1:] if text.startswith(("+", "-")) else text
+    # isdecimal() accepts exactly the digits int() does, so valid values never take the exception path.
+    return int(text) if digits.isdecimal() else None
+
+
+@dataclass(slots=True)
+class _AlbumTrack:
+    """Numeric fields of one file, parsed once while grouping."""
+
+    file_hash: str
+    position: tuple[int, int] | None = None
+    position_warning: str | None = None
+    year: int | None = None
+    total_tracks: int | None = None
+    total_discs: int | None = None
+    totals_warnings: list[str] = field(default_factory=list)
+
+
 @final
 class AlbumManager:
     """Album manager for organizing music files."""
 
     conn: Connection
     album_dao: AlbumDAO
+    _album_cache: dict[tuple[str, str], AlbumInfo]
 
     def __init__(self, conn: Connection):
         """Initialize album manager.
@@ -31,13 +63,22 @@ class AlbumManager:
         """
         self.conn = conn
         self.album_dao = AlbumDAO(conn)
+        # Committed albums keyed by (album_name, album_artist); rows are never updated here,
+        # so entries stay valid for the manager's lifetime.
+        self._album_cache = {}
 
-    def process_files(self, files: dict[str, dict[str, str | None]]) -> tuple[list[AlbumGroup], list[str]]:
+    def process_files(
+        self, files: Iterable[tuple[str, Mapping[str, str | None]]]
+    ) -> tuple[list[AlbumGroup], list[str]]:
         """Process files and group them into albums.
 
+        Files are consumed in a single pass and only their parsed album fields are kept,
+        so the input may be a lazily produced stream. Repeated file hashes are ignored
+        after their first occurrence.
+
         Args:
-            files: Dictionary mapping file hashes to metadata.
-                The metadata dictionary contains optional string values for each field.
+            files: Pairs of file hash and metadata.
+                The metadata mapping contains optional string values for each field.
 
         Returns:
             tuple[list[AlbumGroup], list[str]]: A tuple containing:
@@ -47,9 +88,13 @@ class AlbumManager:
         warnings: list[str] = []
         album_groups: list[AlbumGroup] = []
 
-        # Group files by album name and album artist.
-        album_files: dict[tuple[str, str], set[str]] = {}
-        for file_hash, metadata in files.items():
+        # Group files by album name and album artist, parsing each file's numbers once.
+        album_tracks: dict[tuple[str, str], list[_AlbumTrack]] = {}
+        seen_hashes: set[str] = set()
+        for file_hash, metadata in files:
+            if file_hash in seen_hashes:
+                continue
+            seen_hashes.add(file_hash)
             album_name = metadata.get("album")
             album_artist = metadata.get("album_artist")
 
@@ -60,68 +105,142 @@ class AlbumManager:
                 continue
 
             key = (album_name, album_artist)
-            album_files.setdefault(key, set()).add(file_hash)
+            album_tracks.setdefault(key, []).append(self._parse_track(file_hash, metadata))
+
+        # Process each album group; all albums and track positions share one commit.
+        with self.album_dao.batch():
+            for (album_name, album_artist), tracks in album_tracks.items():
+                group = self._process_album_group(album_name, album_artist, tracks)
+                album_groups.append(group)
+
+            # Check track continuity for every album with one lookup.
+            album_positions = self.album_dao.get_tracks_for_albums(group.album_info.id for group in album_groups)
+            for group in album_groups:
+                is_continuous, continuity_warnings = evaluate_track_continuity(
+                    album_positions.get(group.album_info.id, [])
+                )
+                if not is_continuous:
+                    group.warnings.extend(continuity_warnings)
 
-        # Process each album group.
-        for (album_name, album_artist), file_hashes in album_files.items():
-            group = self._process_album_group(album_name, album_artist, file_hashes, files)
-            album_groups.append(group)
+        # Only cache albums once their rows are committed.
+        for group in album_groups:
+            info = group.album_info
+            if info.id > 0:
+                self._album_cache[(info.album_name, info.album_artist)] = info
 
         return album_groups, warnings
 
+    def _parse_track(self, file_hash: str, metadata: Mapping[str, str | None]) -> _AlbumTrack:
+        """Parse the numeric fields of a file's metadata.
+
+        Args:
+            file_hash: File hash.
+            metadata: File metadata with optional string values.
+
+        Returns:
+            _AlbumTrack: Parsed position, year, and totals with any warnings they raised.
+        """
+        track = _AlbumTrack(file_hash=file_hash)
+
+        disc_info = metadata.get("disc_number")
+        track_info = metadata.get("track_number")
+        if "disc_number" not in metadata or "track_number" not in metadata:
+            track.position_warning = (
+                f"Missing track position for file {file_hash}: disc={disc_info}, track={track_info}"
+            )
+        else:
+            disc_number = _parse_int(disc_info or "0")
+            track_number = _parse_int(track_info or "0")
+            if disc_number is None or track_number is None:
+                track.position_warning = (
+                    f"Invalid track position for file {file_hash}: disc={disc_info}, track={track_info}"
+                )
+            else:
+                track.position = (disc_number, track_number)
+
+        # Ignore unparsable and non-positive/clearly invalid years
+        year = _parse_int(metadata.get("year"))
+        if year is not None and year > 0:
+            track.year = year
+
+        total_tracks = metadata.get("total_tracks")
+        track.total_tracks = _parse_int(total_tracks)
+        if total_tracks and track.total_tracks is None:
+            track.totals_warnings.append(f"Invalid total_tracks value for file {file_hash}: {total_tracks}")
+        total_discs = metadata.get("total_discs")
+        track.total_discs = _parse_int(total_discs)
+        if total_discs and track.total_discs is None:
+            track.totals_warnings.append(f"Invalid total_discs value for file {file_hash}: {total_discs}")
+
+        return track
+
     def _process_album_group(
         self,
         album_name: str,
         album_artist: str,
-        file_hashes: set[str],
-        files: dict[str, dict[str, str | None]],
+        tracks: list[_AlbumTrack],
     ) -> AlbumGroup:
         """Process an album group.
 
         Args:
             album_name: Album name.
             album_artist: Album artist name.
-            file_hashes: Set of file hashes in the album.
-            files: Dictionary mapping file hashes to metadata.
+            tracks: Parsed files in the album.
 
         Returns:
             AlbumGroup: Album group information containing:
                 - Album info (id, name, artist, year, track/disc totals).
-                - Set of file hashes in the album.
+                - File hashes in the album, in input order.
                 - List of warnings specific to this album.
         """
         warnings: list[str] = []
 
+        # Collect album properties and track positions in a single pass.
+        # Album year is defined as the earliest (smallest) valid year among tracks in the album;
+        # for totals, the last file that provides a value wins.
+        year: int | None = None
+        total_tracks: int | None = None
+        total_discs: int | None = None
+        totals_warnings: list[str] = []
+        position_warnings: list[str] = []
+        positions: list[tuple[int, int, str]] = []
+        for track in tracks:
+            if track.year is not None and (year is None or track.year < year):
+                year = track.year
+            if track.total_tracks is not None:
+                total_tracks = track.total_tracks
+            if track.total_discs is not None:
+                total_discs = track.total_discs
+            totals_warnings.extend(track.totals_warnings)
+            if track.position is not None:
+                disc_number, track_number = track.position
+                positions.append((disc_number, track_number, track.file_hash))
+            elif track.position_warning is not None:
+                position_warnings.append(track.position_warning)
+
         # Retrieve the album if exists, otherwise create a new one.
-        album_info = self._get_or_create_album(album_name, album_artist, file_hashes, files, warnings)
-
-        # Register track positions.
-        for file_hash in file_hashes:
-            metadata = files[file_hash]
-            if "disc_number" not in metadata or "track_number" not in metadata:
-                disc_info = metadata.get("disc_number")
-                track_info = metadata.get("track_number")
-                warnings.append(f"Missing track position for file {file_hash}: disc={disc_info}, track={track_info}")
-                continue
+        album_info = self._get_or_create_album(
+            album_name,
+            album_artist,
+            year=year,
+            total_tracks=total_tracks,
+            total_discs=total_discs,
+            totals_warnings=totals_warnings,
+            warnings=warnings,
+        )
+        warnings.extend(position_warnings)
 
-            try:
-                disc_number = int(metadata["disc_number"] or "0")
-                track_number = int(metadata["track_number"] or "0")
-                if not self.album_dao.insert_track_position(album_info.id, disc_number, track_number, file_hash):
-                    warnings.append(f"Failed to register track position for file {file_hash}")
-            except ValueError:
-                disc_info = metadata.get("disc_number")
-                track_info = metadata.get("track_number")
-                warnings.append(f"Invalid track position for file {file_hash}: disc={disc_info}, track={track_info}")
-
-        # Check track continuity.
-        is_continuous, continuity_warnings = self.album_dao.check_track_continuity(album_info.id)
-        if not is_continuous:
-            warnings.extend(continuity_warnings)
+        # Register the valid track positions with a single commit.
+        inserted = self.album_dao.insert_track_positions(
+            (album_info.id, disc_number, track_number, file_hash) for disc_number, track_number, file_hash in positions
+        )
+        for (_, _, file_hash), success in zip(positions, inserted, strict=True):
+            if not success:
+                warnings.append(f"Failed to register track position for file {file_hash}")
 
         return AlbumGroup(
             album_info=album_info,
-            file_hashes=file_hashes,
+            file_hashes=[track.file_hash for track in tracks],
             warnings=warnings,
         )
 
@@ -129,8 +248,11 @@ class AlbumManager:
         self,
         album_name: str,
         album_artist: str,
-        file_hashes: set[str],
-        files: dict[str, dict[str, str | None]],
+        *,
+        year: int | None,
+        total_tracks: int | None,
+        total_discs: int | None,
+        totals_warnings: list[str],
         warnings: list[str],
     ) -> AlbumInfo:
         """Retrieve an existing album or create a new one if not found.
@@ -138,23 +260,25 @@ class AlbumManager:
         Args:
             album_name: Album name.
             album_artist: Album artist name.
-            file_hashes: Set of file hashes associated with the album.
-            files: Dictionary mapping file hashes to metadata.
+            year: Year for a newly created album.
+            total_tracks: Total tracks for a newly created album.
+            total_discs: Total discs for a newly created album.
+            totals_warnings: Warnings raised while parsing the totals; reported only on creation.
             warnings: List to which warning messages are appended.
 
         Returns:
             AlbumInfo: Retrieved or newly created album information.
         """
-        album_info = self.album_dao.get_album(album_name, album_artist)
+        album_info = self._album_cache.get((album_name, album_artist))
+        if album_info is None:
+            album_info = self.album_dao.get_album(album_name, album_artist)
         if album_info:
             return album_info
 
-        # Determine album properties.
-        # Album year is defined as the earliest (smallest) valid year among tracks in the album.
-        year = self._get_earliest_year(file_hashes, files)
-        total_tracks, total_discs = self._calculate_album_totals(file_hashes, files, warnings)
+        warnings.extend(totals_warnings)
 
-        # Attempt to create new album.
+        # Attempt to create new album. The row holds exactly the values inserted here, so
+        # the result is built directly instead of reading the album back.
         album_id = self.album_dao.insert_album(
             album_name=album_name,
             album_artist=album_artist,
@@ -164,91 +288,12 @@ class AlbumManager:
         )
         if not album_id:
             warnings.append(f"Failed to create album: {album_name}")
-            return AlbumInfo(
-                id=-1,
-                album_name=album_name,
-                album_artist=album_artist,
-                year=year,
-                total_tracks=total_tracks,
-                total_discs=total_discs,
-            )
-
-        album_info = self.album_dao.get_album(album_name, album_artist)
-        if not album_info:
-            warnings.append(f"Failed to get album after creation: {album_name}")
-            return AlbumInfo(
-                id=-1,
-                album_name=album_name,
-                album_artist=album_artist,
-                year=year,
-                total_tracks=total_tracks,
-                total_discs=total_discs,
-            )
-
-        return album_info
-
-    def _calculate_album_totals(
-        self,
-        file_hashes: set[str],
-        files: dict[str, dict[str, str | None]],
-        warnings: list[str],
-    ) -> tuple[int | None, int | None]:
-        """Calculate total tracks and discs for the album based on file metadata.
-
-        Args:
-            file_hashes: Set of file hashes associated with the album.
-            files: Dictionary mapping file hashes to metadata.
-            warnings: List to which warning messages are appended.
-
-        Returns:
-            tuple[int | None, int | None]: A tuple containing total_tracks and total_discs.
-        """
-        total_tracks: int | None = None
-        total_discs: int | None = None
-
-        for file_hash in file_hashes:
-            metadata = files[file_hash]
-            if "total_tracks" in metadata and metadata["total_tracks"]:
-                try:
-                    total_tracks = int(metadata["total_tracks"])
-                except ValueError:
-                    warnings.append(f"Invalid total_tracks value for file {file_hash}: {metadata['total_tracks']}")
-            if "total_discs" in metadata and metadata["total_discs"]:
-                try:
-                    total_discs = int(metadata["total_discs"])
-                except ValueError:
-                    warnings.append(f"Invalid total_discs value for file {file_hash}: {metadata['total_discs']}")
-
-        return total_tracks, total_discs
-
-    def _get_earliest_year(
-        self,
-        file_hashes: set[str],
-        files: dict[str, dict[str, str | None]],
-    ) -> int | None:
-        """Retrieve the earliest year from the provided files.
-
-        Args:
-            file_hashes: Set of file hashes to check.
-            files: Dictionary mapping file hashes to metadata.
 
-        Returns:
-            int | None: The earliest year if found and valid; otherwise, None.
-        """
-        earliest_year: int | None = None
-        for file_hash in file_hashes:
-            metadata = files[file_hash]
-            year_str = metadata.get("year")
-            if not year_str:
-                continue
-            try:
-                year = int(year_str)
-                # Ignore non-positive/clearly invalid years
-                if year <= 0:
-                    continue
-                if earliest_year is None or year < earliest_year:
-                    earliest_year = year
-            except ValueError:
-                # Ignore unparsable values
-                continue
-        return earliest_year
+        return AlbumInfo(
+            id=album_id or -1,
+            album_name=album_name,
+            album_artist=album_artist,
+            year=year,
+            total_tracks=total_tracks,
+            total_discs=total_discs,
+        )
@@ -1,19 +1,46 @@
 """Music file grouping functionality."""
 
+import sys
+from collections.abc import Callable
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import ClassVar
 
+from omym.domain.metadata.track_metadata import TrackMetadata
 from omym.domain.metadata.track_metadata_extractor import MetadataExtractor
 from omym.infra.logger.logger import logger
 
 from omym.domain.organization.path_format import parse_path_format
 
+
+@lru_cache(maxsize=32)
+def _parse_components(path_format: str) -> tuple[str, ...]:
+    """Parse a path format once per distinct format string.
+
+    Args:
+        path_format: Format string (e.g., "AlbumArtist/Album").
+
+    Returns:
+        tuple[str, ...]: Ordered path components; a tuple so cached results stay immutable.
+    """
+    return tuple(parse_path_format(path_format))
+
+
 class MusicGrouper:
     """Group music files based on path format."""
 
-    SUPPORTED_COMPONENTS: ClassVar[set[str]] = {"AlbumArtist", "Album", "Genre", "Year"}
-
-    def group_by_path_format(self, files: list[Path], path_format: str) -> dict[str, dict[str, str | None]]:
+    # No fallback to track artist for AlbumArtist; album_artist is required explicitly.
+    _COMPONENT_GETTERS: ClassVar[dict[str, Callable[[TrackMetadata], str]]] = {
+        "AlbumArtist": lambda metadata: metadata.album_artist or "",
+        "Album": lambda metadata: metadata.album or "",
+        "Genre": lambda metadata: metadata.genre or "",
+        "Year": lambda metadata: str(metadata.year) if metadata.year else "",
+    }
+    SUPPORTED_COMPONENTS: ClassVar[set[str]] = set(_COMPONENT_GETTERS)
+    MAX_EXTRACT_WORKERS: ClassVar[int] = 4
+
+    def group_by_path_format(self, files: list[Path], path_format: str) -> dict[str, TrackMetadata]:
         """Group files based on the specified path format.
 
         Args:
@@ -21,11 +48,10 @@ class MusicGrouper:
             path_format: Format string (e.g., "AlbumArtist/Album").
 
         Returns:
-            dict[str, dict[str, str | None]]: Dictionary mapping file paths to metadata.
-                The metadata dictionary contains optional string values for each metadata field.
+            dict[str, TrackMetadata]: Dictionary mapping file paths to their extracted metadata.
         """
-        result: dict[str, dict[str, str | None]] = {}
-        components = parse_path_format(path_format)
+        result: dict[str, TrackMetadata] = {}
+        components = _parse_components(path_format)
 
         # Validate components
         invalid_components = [c for c in components if c not in self.SUPPORTED_COMPONENTS]
@@ -37,34 +63,30 @@ class MusicGrouper:
             )
             return result
 
-        for file_path in files:
+        if not files:
+            return result
+
+        # Components are validated above, so each one resolves to a getter once per call.
+        getters = [(component, self._COMPONENT_GETTERS[component]) for component in components]
+
+        # Tag reads are I/O-bound, so they overlap on a small thread pool while the results
+        # are validated here in file order. Extraction errors resurface from result().
+        with ThreadPoolExecutor(
+            max_workers=min(len(files), self.MAX_EXTRACT_WORKERS),
+            thread_name_prefix="omym-group",
+        ) as extract_pool:
+            extractions = [extract_pool.submit(MetadataExtractor.extract, file_path) for file_path in files]
+
+        for file_path, extraction in zip(files, extractions, strict=True):
             try:
                 # Extract metadata
-                metadata = MetadataExtractor.extract(file_path)
+                metadata = extraction.result()
                 if not metadata:
                     logger.warning("Failed to extract metadata from %s", file_path)
                     continue
 
-                # Convert metadata to dictionary
-                metadata_dict: dict[str, str | None] = {
-                    "title": metadata.title,
-                    "artist": metadata.artist,
-                    "album": metadata.album,
-                    "album_artist": metadata.album_artist,
-                    "genre": metadata.genre,
-                    "year": str(metadata.year) if metadata.year else None,
-                    "track_number": str(metadata.track_number) if metadata.track_number else None,
-                    "track_total": str(metadata.track_total) if metadata.track_total else None,
-                    "disc_number": str(metadata.disc_number) if metadata.disc_number else None,
-                    "disc_total": str(metadata.disc_total) if metadata.disc_total else None,
-                }
-
                 # Check if all required components have values
-                missing_components: list[str] = []
-                for component in components:
-                    value = self._get_component_value(component, metadata_dict)
-                    if not value:
-                        missing_components.append(component)
+                missing_components = [component for component, getter in getters if not getter(metadata)]
 
                 if missing_components:
                     logger.warning(
@@ -74,33 +96,17 @@ class MusicGrouper:
                     )
                     continue
 
+                # Tracks of one album repeat the same names; share a single string per value
+                # across the retained metadata.
+                if metadata.album:
+                    metadata.album = sys.intern(metadata.album)
+                if metadata.album_artist:
+                    metadata.album_artist = sys.intern(metadata.album_artist)
+
                 # Add to result
-                result[str(file_path)] = metadata_dict
+                result[str(file_path)] = metadata
 
             except Exception as e:
                 logger.error("Failed to process file %s: %s", file_path, e)
 
         return result
-
-    def _get_component_value(self, component: str, metadata: dict[str, str | None]) -> str:
-        """Get the value for a path component from metadata.
-
-        Args:
-            component: Component name (e.g., "AlbumArtist").
-            metadata: File metadata dictionary with optional string values.
-
-        Returns:
-            str: Component value, empty string if not found.
-        """
-        if component == "AlbumArtist":
-            # No fallback to track artist; require album_artist explicitly
-            return metadata.get("album_artist") or ""
-        elif component == "Album":
-            return metadata.get("album") or ""
-        elif component == "Genre":
-            return metadata.get("genre") or ""
-        elif component == "Year":
-            return metadata.get("year") or ""
-        else:
-            logger.warning("Unknown path component: %s", component)
-            return ""
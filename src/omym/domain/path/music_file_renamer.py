@@ -1,6 +1,7 @@
 """Renaming logic functionality."""
 
 import re
+from functools import lru_cache
 from typing import ClassVar, Protocol, final, runtime_checkable
 from pathlib import Path
 from unidecode import unidecode
@@ -26,6 +27,17 @@ class ArtistCacheWriter(Protocol):
         ...
 
 
+@final
+class _UncachedLatinization(Exception):
+    """Carries a latinization result that must not be memoized."""
+
+    text: str
+
+    def __init__(self, text: str) -> None:
+        super().__init__(text)
+        self.text = text
+
+
 @final
 class ArtistIdGenerator:
     """Generate artist IDs."""
@@ -91,6 +103,37 @@ class ArtistIdGenerator:
             logger.warning("Japanese transliteration failed for '%s': %s", text, e)
             return text
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _latinize_cached(artist_name: str) -> str:
+        """Detect the language of an artist name and convert it to Latin script.
+
+        Memoized per stripped name: albums repeat the same artist on every track, and
+        language detection plus transliteration dominate the cost of generating an ID.
+        Exceptions are never cached, so failures are retried on the next call.
+
+        Args:
+            artist_name: Stripped artist name to convert.
+
+        Returns:
+            str: The name in Latin script.
+
+        Raises:
+            _UncachedLatinization: If transliteration failed and handed back its input, which
+                is used as-is but must not be memoized.
+        """
+        # Detect language using langid
+        lang, _ = langid.classify(artist_name)
+        # Treat Chinese as Japanese since langid often detects Japanese kanji as Chinese
+        if lang in ["ja", "zh"]:
+            # Use pykakasi for Japanese text
+            latin = ArtistIdGenerator._transliterate_japanese(artist_name)
+            if latin == artist_name:
+                raise _UncachedLatinization(latin)
+            return latin
+        # Use unidecode for all other languages
+        return unidecode(artist_name)
+
     @classmethod
     def generate(cls, artist_name: str | None) -> str:
         """Generate an artist ID (up to 5 characters) from an artist name.
@@ -130,17 +173,11 @@ class ArtistIdGenerator:
                     artist_name = "".join(parts)
 
             # First, try to detect language and transliterate if needed
-            name = artist_name
             try:
-                # Detect language using langid
-                lang, _ = langid.classify(name)
-                # Treat Chinese as Japanese since langid often detects Japanese kanji as Chinese
-                if lang in ["ja", "zh"]:
-                    # Use pykakasi for Japanese text
-                    name = cls._transliterate_japanese(name)
-                else:
-                    # Use unidecode for all other languages
-                    name = unidecode(name)
+                name = cls._latinize_cached(artist_name.strip())
+            except _UncachedLatinization as e:
+                # Transliteration already logged its failure and kept the original text
+                name = e.text
             except Exception as e:
                 logger.warning(
                     "Language detection/transliteration failed for '%s': %s",
@@ -1,5 +1,6 @@
 """Cache DAO exports."""
 
 from .artist_cache_dao import ArtistCacheDAO
+from .file_hash_cache_dao import FileHashCacheDAO
 
-__all__ = ["ArtistCacheDAO"]
+__all__ = ["ArtistCacheDAO", "FileHashCacheDAO"]
@@ -2,12 +2,17 @@
 
 import sqlite3
 import threading
+from collections.abc import Iterable
 from typing import final
 
 from omym.infra.logger.logger import logger
 
 _DEFAULT_ARTIST_ID = "NOART"
 _DEFAULT_ROMANIZATION_SOURCE = "musicbrainz"
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds.
+_BULK_QUERY_CHUNK_SIZE = 500
+# SQLite's built-in LOWER() only folds ASCII letters; mirror it when keying bulk results.
+_SQLITE_LOWER_TABLE = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
 
 
 @final
@@ -15,16 +20,22 @@ class ArtistCacheDAO:
     """Data access object for artist_cache table."""
 
     conn: sqlite3.Connection
+    read_conn: sqlite3.Connection
     _lock: threading.Lock
+    _read_lock: threading.Lock
 
-    def __init__(self, conn: sqlite3.Connection) -> None:
+    def __init__(self, conn: sqlite3.Connection, read_conn: sqlite3.Connection | None = None) -> None:
         """Initialize DAO.
 
         Args:
             conn: Database connection.
+            read_conn: Optional read-only connection for lookups, so they do not queue
+                behind writes on ``conn``. Defaults to ``conn``.
         """
         self.conn = conn
         self._lock = threading.Lock()
+        self.read_conn = read_conn if read_conn is not None else conn
+        self._read_lock = self._lock if self.read_conn is conn else threading.Lock()
 
     def insert_artist_id(self, artist_name: str, artist_id: str) -> bool:
         """Insert or update artist ID mapping.
@@ -73,8 +84,8 @@ class ArtistCacheDAO:
             normalized_name = artist_name.strip()
             if not normalized_name:
                 return None
-            with self._lock:
-                cursor = self.conn.cursor()
+            with self._read_lock:
+                cursor = self.read_conn.cursor()
                 _ = cursor.execute(
                     """
                     SELECT artist_id 
@@ -96,8 +107,8 @@ class ArtistCacheDAO:
         if not normalized_name:
             return None
         try:
-            with self._lock:
-                cursor = self.conn.cursor()
+            with self._read_lock:
+                cursor = self.read_conn.cursor()
                 _ = cursor.execute(
                     """
                     SELECT romanized_name
@@ -115,6 +126,56 @@ class ArtistCacheDAO:
             logger.warning("Failed to fetch romanized name for '%s': %s", normalized_name, e)
             return None
 
+    def get_romanized_names(self, artist_names: Iterable[str]) -> dict[str, str]:
+        """Retrieve cached romanized names for many artists in as few queries as possible.
+
+        Args:
+            artist_names: Artist names to look up.
+
+        Returns:
+            Mapping of normalized (stripped) artist name to its cached romanized name.
+            Names without a cached romanization are omitted.
+        """
+
+        keys_by_folded: dict[str, list[str]] = {}
+        for artist_name in artist_names:
+            normalized_name = artist_name.strip()
+            if not normalized_name:
+                continue
+            folded = normalized_name.translate(_SQLITE_LOWER_TABLE)
+            keys = keys_by_folded.setdefault(folded, [])
+            if normalized_name not in keys:
+                keys.append(normalized_name)
+
+        if not keys_by_folded:
+            return {}
+
+        folded_names = list(keys_by_folded)
+        resolved: dict[str, str] = {}
+        try:
+            with self._read_lock:
+                cursor = self.read_conn.cursor()
+                for start in range(0, len(folded_names), _BULK_QUERY_CHUNK_SIZE):
+                    chunk = folded_names[start : start + _BULK_QUERY_CHUNK_SIZE]
+                    placeholders = ", ".join("?" for _ in chunk)
+                    _ = cursor.execute(
+                        f"""
+                        SELECT LOWER(artist_name), romanized_name
+                        FROM artist_cache
+                        WHERE LOWER(artist_name) IN ({placeholders})
+                        """,
+                        chunk,
+                    )
+                    for folded, romanized in cursor.fetchall():
+                        if not isinstance(romanized, str) or not romanized.strip():
+                            continue
+                        for key in keys_by_folded.get(folded, ()):
+                            _ = resolved.setdefault(key, romanized)
+        except sqlite3.Error as e:
+            logger.warning("Failed to fetch romanized names in bulk: %s", e)
+            return {}
+        return resolved
+
     def upsert_romanized_name(
         self,
         artist_name: str,
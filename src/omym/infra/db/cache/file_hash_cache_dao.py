@@ -0,0 +1,103 @@
+"""Data access object for file_hash_cache table."""
+
+import sqlite3
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import final
+
+from omym.infra.logger.logger import logger
+
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds.
+_BULK_QUERY_CHUNK_SIZE = 500
+
+
+@final
+class FileHashCacheDAO:
+    """Data access object for file_hash_cache table.
+
+    Maps a file path to the SHA-256 digest computed for it, together with the size and
+    modification time observed at hashing time. A lookup only hits when both still match,
+    so unchanged files can skip re-hashing on later runs.
+    """
+
+    conn: sqlite3.Connection
+    read_conn: sqlite3.Connection
+
+    def __init__(self, conn: sqlite3.Connection, read_conn: sqlite3.Connection | None = None) -> None:
+        """Initialize DAO.
+
+        Args:
+            conn: Database connection.
+            read_conn: Optional read-only connection for lookups. Defaults to ``conn``.
+        """
+        self.conn = conn
+        self.read_conn = read_conn if read_conn is not None else conn
+
+    def get_cached_hashes(self, file_stats: Mapping[Path, tuple[int, int]]) -> dict[Path, str]:
+        """Return cached hashes for files whose size and mtime are unchanged.
+
+        Args:
+            file_stats: Mapping of file path to its current ``(size, mtime_ns)``.
+
+        Returns:
+            Mapping of file path to cached hash for every still-valid entry.
+        """
+        if not file_stats:
+            return {}
+
+        paths_by_key = {str(path): path for path in file_stats}
+        keys = list(paths_by_key)
+        hits: dict[Path, str] = {}
+        try:
+            cursor = self.read_conn.cursor()
+            for start in range(0, len(keys), _BULK_QUERY_CHUNK_SIZE):
+                chunk = keys[start : start + _BULK_QUERY_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                _ = cursor.execute(
+                    f"""
+                    SELECT file_path, file_size, mtime_ns, file_hash
+                    FROM file_hash_cache
+                    WHERE file_path IN ({placeholders})
+                    """,
+                    chunk,
+                )
+                for file_path, file_size, mtime_ns, file_hash in cursor.fetchall():
+                    path = paths_by_key[file_path]
+                    if file_stats[path] == (file_size, mtime_ns):
+                        hits[path] = file_hash
+            return hits
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            return {}
+
+    def upsert_hashes(self, entries: Iterable[tuple[Path, int, int, str]]) -> bool:
+        """Insert or refresh cached hashes.
+
+        Args:
+            entries: ``(path, size, mtime_ns, file_hash)`` tuples to store.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            cursor = self.conn.cursor()
+            _ = cursor.executemany(
+                """
+                INSERT INTO file_hash_cache (
+                    file_path,
+                    file_size,
+                    mtime_ns,
+                    file_hash
+                ) VALUES (?, ?, ?, ?)
+                ON CONFLICT(file_path) DO UPDATE SET
+                    file_size = excluded.file_size,
+                    mtime_ns = excluded.mtime_ns,
+                    file_hash = excluded.file_hash,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                ((str(path), size, mtime_ns, file_hash) for path, size, mtime_ns, file_hash in entries),
+            )
+            return True
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            return False
@@ -1,11 +1,16 @@
 """Data access object for album management."""
 
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
 from sqlite3 import Connection
 from dataclasses import dataclass
 from typing import final
 
 from omym.infra.logger.logger import logger
 
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds.
+_BULK_QUERY_CHUNK_SIZE = 500
+
 
 @dataclass
 class AlbumInfo:
@@ -28,11 +33,53 @@ class TrackPosition:
     file_hash: str
 
 
+def evaluate_track_continuity(tracks: list[TrackPosition]) -> tuple[bool, list[str]]:
+    """Check track number continuity for an album's track positions.
+
+    Args:
+        tracks: Track positions registered for the album.
+
+    Returns:
+        tuple[bool, list[str]]: (is_continuous, list of warnings)
+    """
+    if not tracks:
+        return False, ["No tracks found in album"]
+
+    warnings: list[str] = []
+    disc_tracks: dict[int, list[int]] = {}
+
+    # Group tracks by disc
+    for track in tracks:
+        if track.disc_number not in disc_tracks:
+            disc_tracks[track.disc_number] = []
+        disc_tracks[track.disc_number].append(track.track_number)
+
+    # Check each disc
+    for disc_num, track_nums in disc_tracks.items():
+        track_nums.sort()
+        expected = list(range(1, len(track_nums) + 1))
+        if track_nums != expected:
+            missing = set(expected) - set(track_nums)
+            if missing:
+                warnings.append(f"Missing tracks in disc {disc_num}: {sorted(missing)}")
+
+    # Check disc number continuity
+    disc_nums = sorted(disc_tracks.keys())
+    expected_discs = list(range(1, len(disc_nums) + 1))
+    if disc_nums != expected_discs:
+        missing = set(expected_discs) - set(disc_nums)
+        if missing:
+            warnings.append(f"Missing discs: {sorted(missing)}")
+
+    return len(warnings) == 0, warnings
+
+
 @final
 class AlbumDAO:
     """Data access object for album management."""
 
     conn: Connection
+    _in_batch: bool
 
     def __init__(self, conn: Connection):
         """Initialize DAO.
@@ -41,6 +88,39 @@ class AlbumDAO:
             conn: Database connection.
         """
         self.conn = conn
+        self._in_batch = False
+
+    @contextmanager
+    def batch(self) -> Generator[None]:
+        """Group writes made inside the block into a single transaction.
+
+        Write methods skip their own commit while the block is active; the block commits
+        once on exit and rolls back if it raises. SQLite undoes a failing statement on its
+        own, so one rejected row does not discard earlier writes in the block.
+        """
+        if self._in_batch:
+            yield
+            return
+        self._in_batch = True
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self._in_batch = False
+
+    def _commit(self) -> None:
+        """Commit the current write unless a ``batch`` block will commit it."""
+        if not self._in_batch:
+            self.conn.commit()
+
+    def _rollback(self) -> None:
+        """Roll back a failed write unless it belongs to a ``batch`` block."""
+        if not self._in_batch:
+            self.conn.rollback()
 
     def insert_album(
         self,
@@ -72,12 +152,12 @@ class AlbumDAO:
                 """,
                 (album_name, album_artist, year, total_tracks, total_discs),
             )
-            self.conn.commit()
+            self._commit()
             return cursor.lastrowid
 
         except Exception as e:
             logger.error("Failed to insert album: %s", e)
-            self.conn.rollback()
+            self._rollback()
             return None
 
     def get_album(self, album_name: str, album_artist: str) -> AlbumInfo | None:
@@ -138,14 +218,51 @@ class AlbumDAO:
                 """,
                 (album_id, disc_number, track_number, file_hash),
             )
-            self.conn.commit()
+            self._commit()
             return True
 
         except Exception as e:
             logger.error("Failed to insert track position: %s", e)
-            self.conn.rollback()
+            self._rollback()
             return False
 
+    def insert_track_positions(self, positions: Iterable[tuple[int, int, int, str]]) -> list[bool]:
+        """Insert several track positions with a single commit.
+
+        Each row is inserted on its own so that one conflicting position does not discard
+        the rest; the surviving rows are then committed together.
+
+        Args:
+            positions: ``(album_id, disc_number, track_number, file_hash)`` rows to store.
+
+        Returns:
+            list[bool]: Per-row success flags, in input order.
+        """
+        results: list[bool] = []
+        cursor = self.conn.cursor()
+        for position in positions:
+            try:
+                _ = cursor.execute(
+                    """
+                    INSERT INTO track_positions (
+                        album_id, disc_number, track_number, file_hash
+                    ) VALUES (?, ?, ?, ?)
+                    """,
+                    position,
+                )
+                results.append(True)
+            except Exception as e:
+                logger.error("Failed to insert track position: %s", e)
+                results.append(False)
+
+        try:
+            self._commit()
+        except Exception as e:
+            logger.error("Failed to commit track positions: %s", e)
+            self._rollback()
+            return [False] * len(results)
+        return results
+
     def get_album_tracks(self, album_id: int) -> list[TrackPosition]:
         """Get all tracks in an album.
 
@@ -179,6 +296,46 @@ class AlbumDAO:
             logger.error("Failed to get album tracks: %s", e)
             return []
 
+    def get_tracks_for_albums(self, album_ids: Iterable[int]) -> dict[int, list[TrackPosition]]:
+        """Get the tracks of several albums with one query per chunk of ids.
+
+        Args:
+            album_ids: Album IDs.
+
+        Returns:
+            dict[int, list[TrackPosition]]: Track positions ordered by disc and track number,
+                keyed by album ID. Albums without tracks are omitted.
+        """
+        ids = list(dict.fromkeys(album_ids))
+        tracks: dict[int, list[TrackPosition]] = {}
+        try:
+            cursor = self.conn.cursor()
+            for start in range(0, len(ids), _BULK_QUERY_CHUNK_SIZE):
+                chunk = ids[start : start + _BULK_QUERY_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                _ = cursor.execute(
+                    f"""
+                    SELECT album_id, disc_number, track_number, file_hash
+                    FROM track_positions
+                    WHERE album_id IN ({placeholders})
+                    ORDER BY album_id, disc_number, track_number
+                    """,
+                    chunk,
+                )
+                for album_id, disc_number, track_number, file_hash in cursor.fetchall():
+                    tracks.setdefault(album_id, []).append(
+                        TrackPosition(
+                            disc_number=disc_number,
+                            track_number=track_number,
+                            file_hash=file_hash,
+                        )
+                    )
+            return tracks
+
+        except Exception as e:
+            logger.error("Failed to get album tracks: %s", e)
+            return {}
+
     def check_track_continuity(self, album_id: int) -> tuple[bool, list[str]]:
         """Check track number continuity in an album.
 
@@ -188,34 +345,4 @@ class AlbumDAO:
         Returns:
             tuple[bool, list[str]]: (is_continuous, list of warnings)
         """
-        tracks = self.get_album_tracks(album_id)
-        if not tracks:
-            return False, ["No tracks found in album"]
-
-        warnings: list[str] = []
-        disc_tracks: dict[int, list[int]] = {}
-
-        # Group tracks by disc
-        for track in tracks:
-            if track.disc_number not in disc_tracks:
-                disc_tracks[track.disc_number] = []
-            disc_tracks[track.disc_number].append(track.track_number)
-
-        # Check each disc
-        for disc_num, track_nums in disc_tracks.items():
-            track_nums.sort()
-            expected = list(range(1, len(track_nums) + 1))
-            if track_nums != expected:
-                missing = set(expected) - set(track_nums)
-                if missing:
-                    warnings.append(f"Missing tracks in disc {disc_num}: {sorted(missing)}")
-
-        # Check disc number continuity
-        disc_nums = sorted(disc_tracks.keys())
-        expected_discs = list(range(1, len(disc_nums) + 1))
-        if disc_nums != expected_discs:
-            missing = set(expected_discs) - set(disc_nums)
-            if missing:
-                warnings.append(f"Missing discs: {sorted(missing)}")
-
-        return len(warnings) == 0, warnings
+        return evaluate_track_continuity(self.get_album_tracks(album_id))
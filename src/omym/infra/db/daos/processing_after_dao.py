@@ -2,6 +2,7 @@
 
 import os
 import sqlite3
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any, final
 
@@ -54,6 +55,39 @@ class ProcessingAfterDAO:
             logger.error("Database error: %s", e)
             return False
 
+    def insert_many(self, rows: Iterable[tuple[str, Path, Path]]) -> bool:
+        """Insert several file records with a single statement.
+
+        Args:
+            rows: ``(file_hash, file_path, target_path)`` tuples to store.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            cursor = self.conn.cursor()
+            _ = cursor.executemany(
+                """
+                INSERT INTO processing_after (
+                    file_hash,
+                    file_path,
+                    target_path
+                ) VALUES (?, ?, ?)
+                ON CONFLICT(file_hash) DO UPDATE SET
+                    file_path = excluded.file_path,
+                    target_path = excluded.target_path,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (
+                    (file_hash, str(file_path), str(target_path))
+                    for file_hash, file_path, target_path in rows
+                ),
+            )
+            return True
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            return False
+
     def get_target_path(self, file_hash: str) -> Path | None:
         """Get target path for a file.
 
@@ -1,11 +1,15 @@
 """Data access object for processing_before table."""
 
 import sqlite3
+from collections.abc import Iterable
 from pathlib import Path
 from typing import final
 
 from omym.infra.logger.logger import logger
 
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds.
+_BULK_QUERY_CHUNK_SIZE = 500
+
 
 @final
 class ProcessingBeforeDAO:
@@ -64,6 +68,42 @@ class ProcessingBeforeDAO:
             logger.error("Database error: %s", e)
             return False
 
+    def get_target_paths(self, file_hashes: Iterable[str]) -> dict[str, Path] | None:
+        """Get recorded target paths for many files at once.
+
+        Unlike ``check_file_exists``, this does not check whether the targets still exist.
+
+        Args:
+            file_hashes: File hashes to look up.
+
+        Returns:
+            Mapping of file hash to target path for every hash with a processing_after row,
+            or None if the lookup failed.
+        """
+        keys = list(dict.fromkeys(file_hashes))
+        targets: dict[str, Path] = {}
+        try:
+            cursor = self.conn.cursor()
+            for start in range(0, len(keys), _BULK_QUERY_CHUNK_SIZE):
+                chunk = keys[start : start + _BULK_QUERY_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                _ = cursor.execute(
+                    f"""
+                    SELECT pb.file_hash, pa.target_path
+                    FROM processing_before pb
+                    JOIN processing_after pa ON pb.file_hash = pa.file_hash
+                    WHERE pb.file_hash IN ({placeholders})
+                    """,
+                    chunk,
+                )
+                for file_hash, target_path in cursor.fetchall():
+                    if target_path is not None:
+                        targets[file_hash] = Path(target_path)
+            return targets
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            return None
+
     def insert_file(self, file_hash: str, file_path: Path) -> bool:
         """Insert a file record.
 
@@ -93,6 +133,34 @@ class ProcessingBeforeDAO:
             logger.error("Database error: %s", e)
             return False
 
+    def insert_many(self, rows: Iterable[tuple[str, Path]]) -> bool:
+        """Insert several file records with a single statement.
+
+        Args:
+            rows: ``(file_hash, file_path)`` pairs to store.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            cursor = self.conn.cursor()
+            _ = cursor.executemany(
+                """
+                INSERT INTO processing_before (
+                    file_hash,
+                    file_path
+                ) VALUES (?, ?)
+                ON CONFLICT(file_hash) DO UPDATE SET
+                    file_path = excluded.file_path,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                ((file_hash, str(file_path)) for file_hash, file_path in rows),
+            )
+            return True
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            return False
+
     def _select_processing_before_path(self, file_hash: str) -> Path | None:
         """Fetch file path from processing_before for the given hash.
 
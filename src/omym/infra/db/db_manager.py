@@ -1,8 +1,9 @@
 """Database manager for OMYM."""
 
 import sqlite3
+import threading
 from pathlib import Path
-from typing import final, Any
+from typing import ClassVar, final, Any
 
 from omym.core.filesystem import ensure_directory, ensure_parent_directory
 from omym.infra.logger.logger import logger
@@ -13,8 +14,17 @@ from omym.config.paths import default_data_dir
 class DatabaseManager:
     """Database manager for OMYM."""
 
+    # Read-only WAL connections handed out round-robin by ``get_reader_connection``.
+    READER_POOL_SIZE: ClassVar[int] = 2
+    # Compiled statements kept per connection, keyed by SQL text. DAOs pass constant SQL
+    # strings (or a small fixed set of variants) so repeated calls skip re-preparing.
+    STATEMENT_CACHE_SIZE: ClassVar[int] = 256
+
     db_path: str | Path
     conn: sqlite3.Connection | None
+    _readers: list[sqlite3.Connection]
+    _next_reader: int
+    _reader_lock: threading.Lock
 
     def __init__(self, db_path: Path | str | None = None) -> None:
         """Initialize database manager.
@@ -33,6 +43,9 @@ class DatabaseManager:
         else:
             self.db_path = Path(db_path) if isinstance(db_path, str) else db_path
         self.conn = None
+        self._readers = []
+        self._next_reader = 0
+        self._reader_lock = threading.Lock()
 
     def connect(self) -> None:
         """Connect to database and initialize schema."""
@@ -49,6 +62,7 @@ class DatabaseManager:
                     timeout=30.0,  # Wait up to 30 seconds for locks
                     isolation_level="IMMEDIATE",  # Acquire write lock immediately
                     check_same_thread=False,  # Allow DAO usage from worker threads
+                    cached_statements=self.STATEMENT_CACHE_SIZE,
                 )
             except sqlite3.OperationalError as e:
                 if "unable to open database file" in str(e):
@@ -61,6 +75,11 @@ class DatabaseManager:
                 _ = self.conn.execute("PRAGMA synchronous = NORMAL")
                 _ = self.conn.execute("PRAGMA journal_mode = WAL")
                 _ = self.conn.execute("PRAGMA busy_timeout = 30000")  # 30 seconds in milliseconds
+                # Keep bulk-insert work in memory: temp b-trees, a 64 MiB page cache, and
+                # memory-mapped reads of up to 256 MiB of the database file.
+                _ = self.conn.execute("PRAGMA temp_store = MEMORY")
+                _ = self.conn.execute("PRAGMA cache_size = -65536")
+                _ = self.conn.execute("PRAGMA mmap_size = 268435456")
 
                 # Initialize schema
                 self._init_schema()
@@ -86,6 +105,7 @@ class DatabaseManager:
                 "track_positions",
                 "filter_hierarchies",
                 "filter_values",
+                "file_hash_cache",
             }
 
             _ = cursor.execute(
@@ -98,7 +118,8 @@ class DatabaseManager:
                     'albums',
                     'track_positions',
                     'filter_hierarchies',
-                    'filter_values'
+                    'filter_values',
+                    'file_hash_cache'
                 )
                 """
             )
@@ -229,6 +250,20 @@ class DatabaseManager:
                 """
             )
 
+            # Create file_hash_cache table
+            _ = cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS file_hash_cache (
+                    file_path TEXT PRIMARY KEY,
+                    file_size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    file_hash TEXT NOT NULL,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+
             # Create indexes for better performance
             _ = cursor.execute("CREATE INDEX IF NOT EXISTS idx_albums_name_artist ON albums(album_name, album_artist)")
             _ = cursor.execute("CREATE INDEX IF NOT EXISTS idx_track_positions_file_hash ON track_positions(file_hash)")
@@ -259,9 +294,59 @@ class DatabaseManager:
         if "romanized_at" not in columns:
             _ = cursor.execute("ALTER TABLE artist_cache ADD COLUMN romanized_at DATETIME")
 
+    def get_reader_connection(self) -> sqlite3.Connection:
+        """Return a read-only connection for lookups that may run beside the writer.
+
+        In WAL mode readers do not block the writer connection, so cache lookups issued
+        from worker threads no longer queue behind inserts. Readers only see committed
+        data. In-memory databases cannot be shared across connections, so the writer
+        connection is returned for them.
+
+        Returns:
+            sqlite3.Connection: One of up to ``READER_POOL_SIZE`` read-only connections.
+
+        Raises:
+            RuntimeError: If the database is not connected.
+        """
+        if self.conn is None:
+            raise RuntimeError("Database connection is not initialized")
+        if not isinstance(self.db_path, Path):
+            return self.conn
+
+        with self._reader_lock:
+            if len(self._readers) < self.READER_POOL_SIZE:
+                reader = sqlite3.connect(
+                    f"{self.db_path.resolve().as_uri()}?mode=ro",
+                    uri=True,
+                    timeout=30.0,
+                    check_same_thread=False,  # Allow DAO usage from worker threads
+                    cached_statements=self.STATEMENT_CACHE_SIZE,
+                )
+                _ = reader.execute("PRAGMA cache_size = -16384")
+                _ = reader.execute("PRAGMA mmap_size = 268435456")
+                self._readers.append(reader)
+                return reader
+            reader = self._readers[self._next_reader]
+            self._next_reader = (self._next_reader + 1) % len(self._readers)
+            return reader
+
     def close(self) -> None:
         """Close database connection."""
+        with self._reader_lock:
+            for reader in self._readers:
+                try:
+                    reader.close()
+                except sqlite3.Error as e:
+                    logger.error("Failed to close reader connection: %s", e)
+            self._readers.clear()
+            self._next_reader = 0
         if self.conn:
+            try:
+                # Refresh planner statistics for tables whose contents changed enough (e.g. after
+                # bulk album/track inserts); a no-op when the existing statistics are still fine.
+                _ = self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.warning("Failed to optimize database before closing: %s", e)
             try:
                 self.conn.close()
                 self.conn = None
@@ -89,6 +89,16 @@ CREATE TABLE IF NOT EXISTS artist_cache (
     UNIQUE (artist_name)
 );
 
+-- Table: file_hash_cache
+CREATE TABLE IF NOT EXISTS file_hash_cache (
+    file_path TEXT PRIMARY KEY,
+    file_size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    file_hash TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_albums_name_artist ON albums(album_name, album_artist);
 CREATE INDEX IF NOT EXISTS idx_track_positions_file_hash ON track_positions(file_hash);
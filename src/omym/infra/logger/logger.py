@@ -3,6 +3,9 @@
 import logging
 import logging.handlers
 import os
+import queue
+from collections.abc import Generator
+from contextlib import contextmanager
 from pathlib import Path, PurePath, PurePosixPath, PureWindowsPath
 from typing import Any, ClassVar, override
 from rich.console import Console, ConsoleRenderable
@@ -45,18 +48,21 @@ class WhitePathRichHandler(RichHandler):
         kwargs["omit_repeated_times"] = False
         super().__init__(*args, **kwargs)
 
-    def _format_path(self, path: str, base: str | None = None) -> Text:
+    def _format_path(self, path: str | os.PathLike[str], base: str | os.PathLike[str] | None = None) -> Text:
         """Format a path with colored separators and compact rendering.
 
+        Path objects are accepted as-is so that producers can attach them to log records
+        without converting them up front for handlers that never render the record.
+
         Args:
-            path: Absolute or relative path string to format.
+            path: Absolute or relative path to format.
             base: Optional base path used to relativize ``path`` when possible.
 
         Returns:
             Text: Formatted path with colored separators and ellipsis truncation.
         """
-        pure_path = self._to_pure_path(path)
-        base_path = self._to_pure_path(base) if base else None
+        pure_path = self._to_pure_path(os.fspath(path))
+        base_path = self._to_pure_path(os.fspath(base)) if base else None
 
         display_path: PurePath = pure_path
         if base_path is not None and self._is_relative_to(pure_path, base_path):
@@ -205,7 +211,7 @@ class WhitePathRichHandler(RichHandler):
                 _ = body.append(" @ ")
                 _ = body.append_text(
                     self._format_path(
-                        str(directory),
+                        directory,
                         base=getattr(record, "source_base_path", None),
                     )
                 )
@@ -234,7 +240,7 @@ class WhitePathRichHandler(RichHandler):
             target_base_path = getattr(record, "target_base_path", None)
             if source_path:
                 _ = body.append_text(
-                    self._format_path(str(source_path), base=source_base_path)
+                    self._format_path(source_path, base=source_base_path)
                 )
 
             if event in {
@@ -244,7 +250,7 @@ class WhitePathRichHandler(RichHandler):
             } and target_path:
                 _ = body.append(" → ")
                 _ = body.append_text(
-                    self._format_path(str(target_path), base=target_base_path)
+                    self._format_path(target_path, base=target_base_path)
                 )
 
             file_metrics: list[str] = []
@@ -297,6 +303,58 @@ class WhitePathRichHandler(RichHandler):
         return super().render_message(record, message)
 
 
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that forwards records untouched to an in-process listener."""
+
+    @override
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return the record as-is.
+
+        The stock implementation pre-formats the message and drops ``exc_info`` so records
+        can be pickled; records never leave this process, so keeping them intact lets the
+        Rich handler still render tracebacks and structured extras.
+        """
+
+        return record
+
+
+@contextmanager
+def queued_log_handlers(target: logging.Logger | None = None) -> Generator[None]:
+    """Run the handlers of ``target`` on a background thread while the block executes.
+
+    The logger's handlers are swapped for a single queue handler and driven by a
+    ``QueueListener``, so rendering and file I/O no longer block the calling thread.
+    Queued records are flushed and the original handlers restored on exit. Nested use
+    is a no-op.
+
+    Args:
+        target: Logger whose handlers are moved off-thread. Defaults to the OMYM logger.
+
+    Yields:
+        None.
+    """
+    target_logger = target if target is not None else logging.getLogger("omym")
+    handlers = list(target_logger.handlers)
+    if not handlers or any(isinstance(handler, _PassthroughQueueHandler) for handler in handlers):
+        yield
+        return
+
+    record_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(record_queue, *handlers, respect_handler_level=True)
+    queue_handler = _PassthroughQueueHandler(record_queue)
+    for handler in handlers:
+        target_logger.removeHandler(handler)
+    target_logger.addHandler(queue_handler)
+    listener.start()
+    try:
+        yield
+    finally:
+        target_logger.removeHandler(queue_handler)
+        listener.stop()
+        for handler in handlers:
+            target_logger.addHandler(handler)
+
+
 DEFAULT_LOG_FILE: Path = default_log_file()
 
 
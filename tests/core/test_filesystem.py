@@ -0,0 +1,76 @@
+"""Tests for shared filesystem helpers."""
+
+from __future__ import annotations
+
+import errno
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from omym.core.filesystem import move_file, prune_empty_directories, remove_empty_directories
+
+
+def test_move_file_renames_within_filesystem(tmp_path: Path) -> None:
+    """Same-device moves relink the file without copying."""
+
+    src = tmp_path / "src.mp3"
+    _ = src.write_bytes(b"audio")
+    dest = tmp_path / "dest.mp3"
+
+    move_file(src, dest)
+
+    assert not src.exists()
+    assert dest.read_bytes() == b"audio"
+
+
+def test_move_file_falls_back_to_copy_across_devices(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Cross-device renames fall back to ``shutil.move``."""
+
+    src = tmp_path / "src.mp3"
+    _ = src.write_bytes(b"audio")
+    dest = tmp_path / "dest.mp3"
+    _ = mocker.patch(
+        "omym.core.filesystem.os.rename",
+        side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+    )
+    shutil_move = mocker.patch("omym.core.filesystem.shutil.move")
+
+    move_file(src, dest)
+
+    shutil_move.assert_called_once_with(str(src), str(dest))
+
+
+def test_prune_empty_directories_only_visits_vacated_branches(tmp_path: Path) -> None:
+    """Vacated folders and their empty ancestors go; unrelated empty folders stay."""
+
+    root = tmp_path / "incoming"
+    vacated = root / "Artist" / "Album"
+    vacated.mkdir(parents=True)
+    untouched = root / "Untouched"
+    untouched.mkdir()
+    busy = root / "Busy"
+    busy.mkdir()
+    _ = (busy / "keep.txt").write_text("keep")
+
+    prune_empty_directories([vacated, busy], root)
+
+    assert not (root / "Artist").exists()
+    assert untouched.exists()
+    assert busy.exists()
+    assert root.exists()
+
+
+def test_remove_empty_directories_removes_nested_empty_folders(tmp_path: Path) -> None:
+    """Folders that only contain empty folders go; folders holding files stay."""
+
+    root = tmp_path / "library"
+    (root / "Artist" / "Album" / "Disc1").mkdir(parents=True)
+    busy = root / "Busy"
+    busy.mkdir()
+    _ = (busy / "keep.txt").write_text("keep")
+
+    remove_empty_directories(root)
+
+    assert not (root / "Artist").exists()
+    assert busy.exists()
+    remove_empty_directories(tmp_path / "missing")
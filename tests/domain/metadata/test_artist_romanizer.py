@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+
 from omym.domain.metadata.artist_romanizer import ArtistRomanizer
 from omym.domain.metadata.track_metadata import TrackMetadata
 
@@ -108,3 +110,55 @@ class TestArtistRomanizer:
 
         assert result == "R-宇多田ヒカル, R-米津玄師"
         assert calls == ["宇多田ヒカル", "米津玄師"]
+
+    def test_fetch_context_is_isolated_per_thread(self) -> None:
+        """Context recorded by one romanizer thread is not consumed by another."""
+
+        romanizer = ArtistRomanizer(
+            enabled_supplier=lambda: True,
+            fetcher=lambda _: "Hikaru Utada",
+            language_detector=lambda _: "ja",
+            transliterator=lambda _: "fallback",
+        )
+        worker = threading.Thread(
+            target=romanizer.record_fetch_context,
+            kwargs={"source": "cache", "original": "宇多田ヒカル", "value": "Hikaru Utada"},
+        )
+        worker.start()
+        worker.join()
+
+        assert romanizer._consume_fetch_context("宇多田ヒカル", "Hikaru Utada") is None  # pyright: ignore[reportPrivateUsage] - inspecting thread-local context
+
+        romanizer.record_fetch_context(source="cache", original="宇多田ヒカル", value="Hikaru Utada")
+        assert romanizer._consume_fetch_context("宇多田ヒカル", "Hikaru Utada") == "cache"  # pyright: ignore[reportPrivateUsage] - inspecting thread-local context
+
+    def test_concurrent_requests_for_same_name_fetch_once(self) -> None:
+        """Threads romanizing the same uncached name share one fetch."""
+
+        calls: list[str] = []
+        release = threading.Event()
+
+        def fetcher(name: str) -> str | None:
+            calls.append(name)
+            _ = release.wait(timeout=5)
+            return "Hikaru Utada"
+
+        romanizer = ArtistRomanizer(
+            enabled_supplier=lambda: True,
+            fetcher=fetcher,
+            language_detector=lambda _: "ja",
+            transliterator=lambda _: "fallback",
+        )
+        results: list[str | None] = []
+        workers = [
+            threading.Thread(target=lambda: results.append(romanizer.romanize_name("宇多田ヒカル")))
+            for _ in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        release.set()
+        for worker in workers:
+            worker.join()
+
+        assert calls == ["宇多田ヒカル"]
+        assert results == ["Hikaru Utada"] * 3
@@ -8,7 +8,11 @@ from pytest_mock import MockerFixture
 
 from omym.domain.metadata.artist_romanizer import ArtistRomanizer
 from omym.domain.metadata.track_metadata import TrackMetadata
-from omym.domain.metadata.track_metadata_extractor import MetadataExtractor
+from omym.domain.metadata.track_metadata_extractor import (
+    MetadataExtractor,
+    parse_slash_separated,
+    parse_year,
+)
 
 # Type aliases for metadata dictionaries
 MP3Metadata: TypeAlias = dict[str, list[str]]
@@ -373,3 +377,28 @@ class TestMetadataExtractor:
         finally:
             # Clean up
             test_file.unlink()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("", (None, None)),
+        ("3", (3, None)),
+        ("3/12", (3, 12)),
+        ("3/12/1", (3, 12)),
+        ("/5", (None, 5)),
+        ("a/5", (None, 5)),
+    ],
+)
+def test_parse_slash_separated(value: str, expected: tuple[int | None, int | None]) -> None:
+    """Number and total are parsed independently; extra segments are ignored."""
+    assert parse_slash_separated(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("", None), ("199", None), ("1999", 1999), ("1999-01-02", 1999), ("19a9", None)],
+)
+def test_parse_year(value: str, expected: int | None) -> None:
+    """Only four leading digits form a year."""
+    assert parse_year(value) == expected
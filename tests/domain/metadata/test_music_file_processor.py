@@ -1,7 +1,9 @@
 """Tests for music file processing functionality."""
 
 import logging
+import os
 import sqlite3
+from contextlib import nullcontext
 from pathlib import Path
 from typing import cast
 from unittest.mock import MagicMock
@@ -69,14 +71,18 @@ def processor(mocker: MockerFixture, tmp_path: Path) -> MusicProcessor:
     mock_before_dao = mocker.patch("omym.domain.metadata.music_file_processor.ProcessingBeforeDAO").return_value
     mock_after_dao = mocker.patch("omym.domain.metadata.music_file_processor.ProcessingAfterDAO").return_value
     mock_artist_dao = mocker.patch("omym.domain.metadata.music_file_processor.ArtistCacheDAO").return_value
+    mock_hash_cache_dao = mocker.patch("omym.domain.metadata.music_file_processor.FileHashCacheDAO").return_value
 
     # Configure DAO behavior
     _ = mock_before_dao.check_file_exists.return_value = False
+    _ = mock_before_dao.get_target_paths.return_value = {}
     _ = mock_before_dao.insert_file.return_value = True
     _ = mock_after_dao.insert_file.return_value = True
     _ = mock_artist_dao.get_artist_id.return_value = "PNKFL"
     _ = mock_artist_dao.get_romanized_name.return_value = None
+    _ = mock_artist_dao.get_romanized_names.return_value = {}
     _ = mock_artist_dao.insert_artist_id.return_value = True
+    _ = mock_hash_cache_dao.get_cached_hashes.return_value = {}
 
     # Create processor
     processor = MusicProcessor(base_path=tmp_path)
@@ -260,6 +266,33 @@ class TestMusicProcessor:
         assert not artwork_file.exists()
         assert artwork_result.target_path.exists()
 
+    def test_process_file_duplicate_uses_cached_hash_without_reading(
+        self,
+        processor: MusicProcessor,
+        tmp_path: Path,
+    ) -> None:
+        """A file whose size and mtime match the hash cache is matched without being read."""
+
+        source_file = tmp_path / "song.mp3"
+        source_file.touch()
+        target_path = tmp_path / "library" / "song.mp3"
+        target_path.parent.mkdir(parents=True)
+        target_path.touch()
+
+        hash_cache_mock = cast(MagicMock, processor.hash_cache_dao)
+        hash_cache_mock.get_cached_hashes.return_value = {source_file: "cached-hash"}
+        before_dao_mock = cast(MagicMock, processor.before_dao)
+        before_dao_mock.check_file_exists.return_value = True
+        before_dao_mock.get_target_path.return_value = str(target_path)
+        hash_mock = cast(MagicMock, processor._calculate_file_hash)  # pyright: ignore[reportPrivateUsage] - patched in fixture
+
+        result = processor.process_file(source_file)
+
+        assert result.skipped_duplicate is True
+        assert result.file_hash == "cached-hash"
+        hash_mock.assert_not_called()
+        before_dao_mock.check_file_exists.assert_called_once_with("cached-hash")
+
     def test_process_file_lyrics_conflict(
         self,
         mocker: MockerFixture,
@@ -393,7 +426,9 @@ class TestMusicProcessor:
             (source_dir / name).touch()
 
         # Mock metadata extraction
-        _ = mocker.patch("omym.domain.metadata.music_file_processor.MetadataExtractor.extract", return_value=metadata)
+        extract_mock = mocker.patch(
+            "omym.domain.metadata.music_file_processor.MetadataExtractor.extract", return_value=metadata
+        )
 
         # Mock file hash calculation to return different hashes
         def mock_hash(file_path: Path) -> str:
@@ -408,12 +443,23 @@ class TestMusicProcessor:
 
             return f"{file_path.name}e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
 
-        _ = mocker.patch.object(processor, "_calculate_file_hash", side_effect=mock_hash)
+        hash_mock = mocker.patch.object(processor, "_calculate_file_hash", side_effect=mock_hash)
+        scandir_spy = mocker.spy(os, "scandir")
 
         # Act
         results = processor.process_directory(source_dir)
 
         # Assert
+        assert hash_mock.call_count == len(music_files)  # Hashed once each, ahead of the main loop
+        assert extract_mock.call_count == len(music_files)  # Pre-scan metadata is reused
+        source_scans = [c for c in scandir_spy.call_args_list if Path(c.args[0]) == source_dir]
+        assert len(source_scans) == 2  # Discovery walk plus one listing shared by all tracks
+        before_dao_mock = cast(MagicMock, processor.before_dao)
+        after_dao_mock = cast(MagicMock, processor.after_dao)
+        before_dao_mock.insert_file.assert_not_called()  # Rows are written in one batch
+        after_dao_mock.insert_file.assert_not_called()
+        assert len(before_dao_mock.insert_many.call_args.args[0]) == len(music_files)
+        assert len(after_dao_mock.insert_many.call_args.args[0]) == len(music_files)
         file_results = [r for r in results if r.source_path.suffix.lower() in processor.SUPPORTED_EXTENSIONS]
         assert len(file_results) == len(music_files)
 
@@ -436,6 +482,44 @@ class TestMusicProcessor:
         processed_files = {r.source_path.name for r in results}
         assert processed_files == set(music_files)
 
+    def test_process_directory_reuses_cached_hashes(
+        self,
+        mocker: MockerFixture,
+        processor: MusicProcessor,
+        metadata: TrackMetadata,
+        tmp_path: Path,
+    ) -> None:
+        """Files with a still-valid cached digest are not hashed or checked one by one."""
+
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        cached_file = source_dir / "cached.mp3"
+        fresh_file = source_dir / "fresh.mp3"
+        cached_file.touch()
+        fresh_file.touch()
+
+        _ = mocker.patch(
+            "omym.domain.metadata.music_file_processor.MetadataExtractor.extract",
+            return_value=metadata,
+        )
+        hash_mock = mocker.patch.object(processor, "_calculate_file_hash", return_value="hash-fresh")
+        hash_cache_mock = cast(MagicMock, processor.hash_cache_dao)
+        hash_cache_mock.get_cached_hashes.return_value = {cached_file: "hash-cached"}
+
+        before_dao_mock = cast(MagicMock, processor.before_dao)
+
+        results = processor.process_directory(source_dir)
+
+        hash_mock.assert_called_once_with(fresh_file)
+        before_dao_mock.get_target_paths.assert_called_once()
+        assert list(before_dao_mock.get_target_paths.call_args.args[0]) == ["hash-cached"]
+        before_dao_mock.check_file_exists.assert_called_once_with("hash-fresh")
+        assert {result.file_hash for result in results} == {"hash-cached", "hash-fresh"}
+        hash_cache_mock.upsert_hashes.assert_called_once()
+        stored = hash_cache_mock.upsert_hashes.call_args.args[0]
+        assert any(path == fresh_file and digest == "hash-fresh" for path, _, _, digest in stored)
+        assert all(path != cached_file for path, _, _, _ in stored)
+
     def test_process_directory_emits_structured_logs(
         self,
         mocker: MockerFixture,
@@ -493,7 +577,7 @@ class TestMusicProcessor:
         skip_data = skip_record.__dict__
         processed_source = str(results[0].source_path)
         expected_skip_sources = {str(duplicate_file), str(new_file)} - {processed_source}
-        assert skip_data["source_path"] in expected_skip_sources
+        assert str(skip_data["source_path"]) in expected_skip_sources
         assert str(skip_data["target_path"]).endswith("existing.mp3")
 
         success_record = next(
@@ -533,7 +617,7 @@ class TestMusicProcessor:
             return_value=metadata,
         )
         _ = mocker.patch(
-            "omym.domain.metadata.music_file_processor.remove_empty_directories",
+            "omym.domain.metadata.music_file_processor.prune_empty_directories",
             autospec=True,
         )
 
@@ -611,8 +695,8 @@ class TestMusicProcessor:
             if getattr(record, "processing_event", "") == "processing.file.skip.duplicate"
         )
         skip_data = skip_record.__dict__
-        assert skip_data["target_path"] == str(target_path)
-        assert skip_data["source_path"] == str(source_file)
+        assert skip_data["target_path"] == target_path
+        assert skip_data["source_path"] == source_file
 
     def test_cached_romanization_bypasses_musicbrainz(
         self,
@@ -635,15 +719,74 @@ class TestMusicProcessor:
         processor._schedule_romanization(cached_name)  # pyright: ignore[reportPrivateUsage] - exercising cache-aware path
 
         assert cached_name in processor._romanize_futures  # pyright: ignore[reportPrivateUsage] - validate future caching
-        future = processor._romanize_futures[cached_name]  # pyright: ignore[reportPrivateUsage] - retrieve prepared future
-        assert future.result() == cached_romanized
+        entry = processor._romanize_futures[cached_name]  # pyright: ignore[reportPrivateUsage] - retrieve prepared entry
+        assert entry == cached_romanized
 
         artist_dao_mock.upsert_romanized_name.reset_mock()
 
         assert processor._await_romanization(cached_name) == cached_romanized  # pyright: ignore[reportPrivateUsage] - ensure reuse
         submit_mock.assert_not_called()
         artist_dao_mock.get_romanized_name.assert_called_once_with(cached_name)
-        artist_dao_mock.upsert_romanized_name.assert_called_once_with(cached_name, cached_romanized)
+        artist_dao_mock.upsert_romanized_name.assert_not_called()
+
+    def test_preferred_romanization_is_persisted_once(
+        self,
+        mocker: MockerFixture,
+        processor: MusicProcessor,
+    ) -> None:
+        """A user-preferred name is written to the artist cache on first use only."""
+
+        preferences = mocker.patch.object(processor, "artist_name_preferences")
+        preferences.resolve.return_value = "Preferred Name"
+        artist_dao_mock = cast(MagicMock, processor.artist_dao)
+        artist_dao_mock.upsert_romanized_name.reset_mock()
+
+        processor._schedule_romanization("Original Name")  # pyright: ignore[reportPrivateUsage] - exercising preference path
+
+        assert processor._await_romanization("Original Name") == "Preferred Name"  # pyright: ignore[reportPrivateUsage] - first use
+        assert processor._await_romanization("Original Name") == "Preferred Name"  # pyright: ignore[reportPrivateUsage] - reuse
+        artist_dao_mock.upsert_romanized_name.assert_called_once_with("Original Name", "Preferred Name")
+
+    def test_bulk_romanization_scheduling_uses_single_cache_query(
+        self,
+        mocker: MockerFixture,
+        processor: MusicProcessor,
+    ) -> None:
+        """Batch scheduling consults the cache once and only submits cache misses."""
+
+        artist_dao_mock = cast(MagicMock, processor.artist_dao)
+        artist_dao_mock.get_romanized_names.return_value = {"米津玄師": "Kenshi Yonezu"}
+        submit_mock = mocker.patch.object(
+            processor._romanizer_executor,  # pyright: ignore[reportPrivateUsage] - tests may hook executor internals
+            "submit",
+        )
+
+        processor._schedule_romanizations(["米津玄師", "宇多田ヒカル", "米津玄師", " "])  # pyright: ignore[reportPrivateUsage] - exercising batch path
+
+        artist_dao_mock.get_romanized_names.assert_called_once_with(["米津玄師", "宇多田ヒカル"])
+        artist_dao_mock.get_romanized_name.assert_not_called()
+        assert processor._romanize_futures["米津玄師"] == "Kenshi Yonezu"  # pyright: ignore[reportPrivateUsage] - validate cached entry
+        submit_mock.assert_called_once()
+
+    def test_fetcher_reuses_bulk_romanization_lookups(
+        self,
+        mocker: MockerFixture,
+        processor: MusicProcessor,
+    ) -> None:
+        """Names resolved by the bulk cache query never trigger per-name cache reads."""
+
+        artist_dao_mock = cast(MagicMock, processor.artist_dao)
+        artist_dao_mock.get_romanized_names.return_value = {"米津玄師": "Kenshi Yonezu"}
+        _ = mocker.patch.object(
+            processor._romanizer_executor,  # pyright: ignore[reportPrivateUsage] - tests may hook executor internals
+            "submit",
+        )
+
+        processor._schedule_romanizations(["米津玄師"])  # pyright: ignore[reportPrivateUsage] - warm the lookup
+        fetched = processor._romanizer.fetcher("米津玄師")  # pyright: ignore[reportPrivateUsage] - exercise persistent fetcher
+
+        assert fetched == "Kenshi Yonezu"
+        artist_dao_mock.get_romanized_name.assert_not_called()
 
     def test_file_extension_safety(
         self,
@@ -679,6 +822,11 @@ class TestMusicProcessor:
 
         # Mock metadata extraction
         _ = mocker.patch("omym.domain.metadata.music_file_processor.MetadataExtractor.extract", return_value=metadata)
+        # Distinct hashes so the empty files are not treated as duplicates of each other
+        def _hash(path: Path) -> str:
+            return f"hash-{path.name}"
+
+        _ = mocker.patch.object(processor, "_calculate_file_hash", side_effect=_hash)
 
         # Act
         results = processor.process_directory(source_dir)
@@ -782,6 +930,128 @@ class TestMusicProcessor:
         assert result.target_path.exists()
         assert not source_file.exists()  # Original file should be moved
 
+    def test_find_available_path_skips_taken_suffixes(
+        self,
+        processor: MusicProcessor,
+        tmp_path: Path,
+    ) -> None:
+        """Collision numbering must skip every suffix already present on disk."""
+
+        target_dir = tmp_path / "album"
+        target_dir.mkdir()
+        target = target_dir / "track.mp3"
+        target.touch()
+        (target_dir / "track (1).mp3").touch()
+        (target_dir / "track (2).mp3").touch()
+
+        result = processor._find_available_path(target)  # pyright: ignore[reportPrivateUsage] - exercising collision helper
+
+        assert result == target_dir / "track (3).mp3"
+
+    def test_find_available_path_reuses_lowest_gap(
+        self,
+        processor: MusicProcessor,
+        tmp_path: Path,
+    ) -> None:
+        """Numbering fills the lowest free counter and ignores non-canonical spellings."""
+
+        target_dir = tmp_path / "album"
+        target_dir.mkdir()
+        target = target_dir / "track.mp3"
+        for name in ("track.mp3", "track (1).mp3", "track (02).mp3", "track (3).mp3", "track (x).mp3"):
+            (target_dir / name).touch()
+
+        result = processor._find_available_path(target)  # pyright: ignore[reportPrivateUsage] - exercising collision helper
+
+        assert result == target_dir / "track (2).mp3"
+
+    def test_find_available_path_probes_when_listing_fails(
+        self,
+        mocker: MockerFixture,
+        processor: MusicProcessor,
+        tmp_path: Path,
+    ) -> None:
+        """An unreadable listing falls back to probing candidates on disk."""
+
+        target_dir = tmp_path / "album"
+        target_dir.mkdir()
+        target = target_dir / "track.mp3"
+        target.touch()
+        (target_dir / "track (1).mp3").touch()
+        _ = mocker.patch(
+            "omym.domain.metadata.music_file_processor.os.scandir",
+            side_effect=PermissionError("denied"),
+        )
+
+        result = processor._find_available_path(target)  # pyright: ignore[reportPrivateUsage] - exercising collision helper
+
+        assert result == target_dir / "track (2).mp3"
+
+    def test_find_available_path_matches_siblings_case_insensitively(
+        self,
+        processor: MusicProcessor,
+        tmp_path: Path,
+    ) -> None:
+        """Numbered siblings differing only in case are treated as taken."""
+
+        target_dir = tmp_path / "album"
+        target_dir.mkdir()
+        target = target_dir / "Song.mp3"
+        target.touch()
+        (target_dir / "song (1).MP3").touch()
+
+        result = processor._find_available_path(target)  # pyright: ignore[reportPrivateUsage] - exercising collision helper
+
+        assert result == target_dir / "Song (2).mp3"
+
+    def test_find_available_path_confirms_candidate_on_disk(
+        self,
+        mocker: MockerFixture,
+        processor: MusicProcessor,
+        tmp_path: Path,
+    ) -> None:
+        """A candidate missing from a stale listing is still rejected if it exists."""
+
+        target_dir = tmp_path / "album"
+        target_dir.mkdir()
+        target = target_dir / "track.mp3"
+        target.touch()
+        (target_dir / "track (1).mp3").touch()
+        _ = mocker.patch(
+            "omym.domain.metadata.music_file_processor.os.scandir",
+            return_value=nullcontext([]),
+        )
+
+        result = processor._find_available_path(target)  # pyright: ignore[reportPrivateUsage] - exercising collision helper
+
+        assert result == target_dir / "track (2).mp3"
+
+    def test_move_file_creates_each_parent_once(
+        self,
+        mocker: MockerFixture,
+        processor: MusicProcessor,
+        tmp_path: Path,
+    ) -> None:
+        """Repeated moves into the same album folder only create the folder once."""
+
+        def _ensure(path: Path) -> Path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            return path.parent
+
+        ensure_mock = mocker.patch(
+            "omym.domain.metadata.music_file_processor.ensure_parent_directory",
+            wraps=_ensure,
+        )
+        album_dir = tmp_path / "library" / "album"
+        for name in ("one.mp3", "two.mp3"):
+            source = tmp_path / name
+            source.touch()
+            processor._move_file(source, album_dir / name)  # pyright: ignore[reportPrivateUsage] - exercising move helper
+
+        assert ensure_mock.call_count == 1
+        assert (album_dir / "one.mp3").exists()
+        assert (album_dir / "two.mp3").exists()
+
     def test_safe_file_operations(
         self,
         mocker: MockerFixture,
@@ -804,8 +1074,8 @@ class TestMusicProcessor:
         # Mock metadata extraction
         _ = mocker.patch("omym.domain.metadata.music_file_processor.MetadataExtractor.extract", return_value=metadata)
 
-        # Mock shutil.move to raise an error
-        mock_move = mocker.patch("omym.domain.metadata.music_file_processor.shutil.move")
+        # Mock the move helper to raise an error
+        mock_move = mocker.patch("omym.domain.metadata.music_file_processor.move_file")
         mock_move.side_effect = OSError("Failed to move file: Test error")
 
         # Act
@@ -817,6 +1087,70 @@ class TestMusicProcessor:
         assert source_file.exists()  # Original file should still exist
 
 
+def test_iter_supported_walks_tree_without_following_symlinked_dirs(
+    processor: MusicProcessor, tmp_path: Path
+) -> None:
+    """Recursive discovery yields supported files only and skips symlinked directories."""
+
+    root = tmp_path / "music"
+    nested = root / "Artist" / "Album"
+    nested.mkdir(parents=True)
+    _ = (root / "top.MP3").write_bytes(b"")
+    _ = (nested / "track.flac").write_bytes(b"")
+    _ = (nested / "cover.jpg").write_bytes(b"")
+    (nested / "folder.mp3").mkdir()
+    (root / "link").symlink_to(nested, target_is_directory=True)
+
+    found = dict(processor._iter_supported(root))  # pyright: ignore[reportPrivateUsage] - exercising discovery helper
+
+    assert set(found) == {root / "top.MP3", nested / "track.flac"}
+    track_stat = (nested / "track.flac").stat()
+    assert found[nested / "track.flac"] == (track_stat.st_size, track_stat.st_mtime_ns)
+
+
+def test_get_metadata_reuses_cache_only_while_mtime_matches(
+    mocker: MockerFixture, processor: MusicProcessor, metadata: TrackMetadata, tmp_path: Path
+) -> None:
+    """Cached pre-scan metadata is consumed once and ignored after the file changes."""
+
+    audio_file = tmp_path / "track.mp3"
+    _ = audio_file.write_bytes(b"")
+    fresh = TrackMetadata(title="Fresh")
+    extract_mock = mocker.patch(
+        "omym.domain.metadata.music_file_processor.MetadataExtractor.extract", return_value=fresh
+    )
+    mtime_ns = audio_file.stat().st_mtime_ns
+
+    processor._metadata_cache[audio_file] = (mtime_ns, metadata)  # pyright: ignore[reportPrivateUsage] - seeding cache
+    assert processor._get_metadata(audio_file) is metadata  # pyright: ignore[reportPrivateUsage] - exercising cache hit
+    extract_mock.assert_not_called()
+
+    processor._metadata_cache[audio_file] = (mtime_ns - 1, metadata)  # pyright: ignore[reportPrivateUsage] - seeding stale entry
+    assert processor._get_metadata(audio_file) is fresh  # pyright: ignore[reportPrivateUsage] - exercising stale entry
+    assert processor._get_metadata(audio_file) is fresh  # pyright: ignore[reportPrivateUsage] - entry consumed
+    assert extract_mock.call_count == 2
+
+
+def test_calculate_file_hash_matches_known_vector(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Hashing through both the streaming and mmap paths yields the SHA-256 digest."""
+
+    _ = mocker.patch("omym.domain.metadata.music_file_processor.DatabaseManager").return_value
+    _ = mocker.patch("omym.domain.metadata.music_file_processor.ProcessingBeforeDAO")
+    _ = mocker.patch("omym.domain.metadata.music_file_processor.ProcessingAfterDAO")
+    _ = mocker.patch("omym.domain.metadata.music_file_processor.ArtistCacheDAO")
+    processor = MusicProcessor(base_path=tmp_path)
+    audio_file = tmp_path / "track.mp3"
+    _ = audio_file.write_bytes(b"abc")
+    expected = "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+
+    assert processor._calculate_file_hash(audio_file) == expected  # pyright: ignore[reportPrivateUsage] - exercising hash helper
+
+    _ = mocker.patch.object(MusicProcessor, "MMAP_THRESHOLD", 1)
+    assert processor._calculate_file_hash(audio_file) == expected  # pyright: ignore[reportPrivateUsage] - exercising mmap path
+
+    processor._romanizer_executor.shutdown(wait=False)  # pyright: ignore[reportPrivateUsage] - executor cleanup for test
+
+
 def test_dry_run_skips_persistent_state(
     tmp_path: Path,
     mocker: MockerFixture,
@@ -1,10 +1,13 @@
 """Tests for the album management system."""
 
 import sqlite3
+from collections.abc import Iterator
 
 import pytest
+from pytest_mock import MockerFixture
 
 from omym.domain.organization.album_manager import AlbumManager, AlbumGroup
+from omym.domain.organization.album_manager import _parse_int  # pyright: ignore[reportPrivateUsage] - helper under test
 from omym.infra.db.daos.albums_dao import AlbumInfo
 
 
@@ -80,7 +83,7 @@ def test_process_files_single_album(album_manager: AlbumManager) -> None:
         },
     }
 
-    album_groups, warnings = album_manager.process_files(files)
+    album_groups, warnings = album_manager.process_files(files.items())
 
     assert len(warnings) == 0
     assert len(album_groups) == 1
@@ -93,8 +96,8 @@ def test_process_files_single_album(album_manager: AlbumManager) -> None:
     assert group.album_info.year == 2020
     assert group.album_info.total_tracks == 2
     assert group.album_info.total_discs == 1
-    assert isinstance(group.file_hashes, set)
-    assert group.file_hashes == {"hash1", "hash2"}
+    assert isinstance(group.file_hashes, list)
+    assert group.file_hashes == ["hash1", "hash2"]
     assert isinstance(group.warnings, list)
     assert len(group.warnings) == 0
 
@@ -122,7 +125,7 @@ def test_process_files_multiple_albums(album_manager: AlbumManager) -> None:
         },
     }
 
-    album_groups, warnings = album_manager.process_files(files)
+    album_groups, warnings = album_manager.process_files(files.items())
 
     assert len(warnings) == 0
     assert len(album_groups) == 2
@@ -135,8 +138,8 @@ def test_process_files_multiple_albums(album_manager: AlbumManager) -> None:
     assert group1.album_info.year == 2020
     assert group1.album_info.total_tracks == 1
     assert group1.album_info.total_discs == 1
-    assert isinstance(group1.file_hashes, set)
-    assert group1.file_hashes == {"hash1"}
+    assert isinstance(group1.file_hashes, list)
+    assert group1.file_hashes == ["hash1"]
     assert isinstance(group1.warnings, list)
     assert len(group1.warnings) == 0
 
@@ -148,8 +151,8 @@ def test_process_files_multiple_albums(album_manager: AlbumManager) -> None:
     assert group2.album_info.year == 2021
     assert group2.album_info.total_tracks == 1
     assert group2.album_info.total_discs == 1
-    assert isinstance(group2.file_hashes, set)
-    assert group2.file_hashes == {"hash2"}
+    assert isinstance(group2.file_hashes, list)
+    assert group2.file_hashes == ["hash2"]
     assert isinstance(group2.warnings, list)
     assert len(group2.warnings) == 0
 
@@ -173,7 +176,7 @@ def test_process_files_missing_metadata(album_manager: AlbumManager) -> None:
         },
     }
 
-    album_groups, warnings = album_manager.process_files(files)
+    album_groups, warnings = album_manager.process_files(files.items())
 
     assert len(warnings) == 1
     assert "Missing album information" in warnings[0]
@@ -185,8 +188,8 @@ def test_process_files_missing_metadata(album_manager: AlbumManager) -> None:
     assert isinstance(group.album_info, AlbumInfo)
     assert group.album_info.album_name == "Test Album"
     assert group.album_info.album_artist == "Test Artist"
-    assert isinstance(group.file_hashes, set)
-    assert group.file_hashes == {"hash1", "hash2"}
+    assert isinstance(group.file_hashes, list)
+    assert group.file_hashes == ["hash1", "hash2"]
     assert isinstance(group.warnings, list)
     assert len(group.warnings) == 1
     assert "Missing track position" in group.warnings[0]
@@ -213,7 +216,7 @@ def test_process_files_track_continuity(album_manager: AlbumManager) -> None:
         },
     }
 
-    album_groups, warnings = album_manager.process_files(files)
+    album_groups, warnings = album_manager.process_files(files.items())
 
     assert len(warnings) == 0
     assert len(album_groups) == 1
@@ -226,20 +229,152 @@ def test_process_files_track_continuity(album_manager: AlbumManager) -> None:
     assert "Missing tracks in disc 1: [2]" == group.warnings[0]
 
 
-def test_get_earliest_year(album_manager: AlbumManager) -> None:
-    """Test getting the earliest year from files.
+def test_process_files_uses_earliest_year(album_manager: AlbumManager) -> None:
+    """A new album takes the earliest valid year among its files."""
+    years = {"hash1": "2020", "hash2": "2021", "hash3": "invalid", "hash4": "0", "hash5": None}
+    files: dict[str, dict[str, str | None]] = {
+        file_hash: {
+            "album": "Test Album",
+            "album_artist": "Test Artist",
+            "year": year,
+            "disc_number": "1",
+            "track_number": str(index),
+        }
+        for index, (file_hash, year) in enumerate(years.items(), start=1)
+    }
 
-    Note:
-        This test accesses a protected method for testing purposes.
-        The method is protected to prevent external access while allowing testing.
-    """
+    (group,), _ = album_manager.process_files(files.items())
+
+    assert group.album_info.year == 2020
+
+
+def test_process_files_reports_conflicting_track_positions(album_manager: AlbumManager) -> None:
+    """A duplicate disc/track position is reported without dropping the other tracks."""
     files: dict[str, dict[str, str | None]] = {
-        "hash1": {"year": "2020"},
-        "hash2": {"year": "2021"},
-        "hash3": {"year": "invalid"},
-        "hash4": {},
+        f"hash{index}": {
+            "album": "Test Album",
+            "album_artist": "Test Artist",
+            "disc_number": "1",
+            "track_number": track,
+        }
+        for index, track in enumerate(["1", "2", "2"], start=1)
+    }
+
+    album_groups, _ = album_manager.process_files(files.items())
+
+    group = album_groups[0]
+    tracks = album_manager.album_dao.get_album_tracks(group.album_info.id)
+    assert [track.track_number for track in tracks] == [1, 2]
+    rejected = ({"hash2", "hash3"} - {track.file_hash for track in tracks}).pop()
+    assert group.warnings == [f"Failed to register track position for file {rejected}"]
+
+
+def test_process_files_reuses_existing_album(album_manager: AlbumManager, mocker: MockerFixture) -> None:
+    """A second batch for the same album resolves to the cached row created by the first."""
+    first: dict[str, dict[str, str | None]] = {
+        "hash1": {
+            "album": "Test Album",
+            "album_artist": "Test Artist",
+            "year": "2020",
+            "disc_number": "1",
+            "track_number": "1",
+        },
     }
-    file_hashes: set[str] = {"hash1", "hash2", "hash3", "hash4"}
+    second: dict[str, dict[str, str | None]] = {
+        "hash2": {
+            "album": "Test Album",
+            "album_artist": "Test Artist",
+            "year": "1999",
+            "disc_number": "1",
+            "track_number": "2",
+        },
+    }
+
+    (created,), _ = album_manager.process_files(first.items())
+    get_album = mocker.spy(album_manager.album_dao, "get_album")
+    (reused,), _ = album_manager.process_files(second.items())
 
-    year = album_manager._get_earliest_year(file_hashes, files)  # pyright: ignore[reportPrivateUsage]
-    assert year == 2020
+    get_album.assert_not_called()
+    assert created.album_info.id > 0
+    assert reused.album_info == created.album_info
+
+
+def test_process_files_checks_continuity_with_one_lookup(album_manager: AlbumManager, mocker: MockerFixture) -> None:
+    """Continuity for all albums comes from a single bulk track lookup."""
+    files: dict[str, dict[str, str | None]] = {
+        "hash1": {"album": "Album A", "album_artist": "Artist", "disc_number": "1", "track_number": "1"},
+        "hash2": {"album": "Album A", "album_artist": "Artist", "disc_number": "1", "track_number": "3"},
+        "hash3": {"album": "Album B", "album_artist": "Artist", "disc_number": "1", "track_number": "1"},
+    }
+    bulk_lookup = mocker.spy(album_manager.album_dao, "get_tracks_for_albums")
+    per_album_check = mocker.spy(album_manager.album_dao, "check_track_continuity")
+
+    groups, _ = album_manager.process_files(files.items())
+
+    bulk_lookup.assert_called_once()
+    per_album_check.assert_not_called()
+    warnings = {group.album_info.album_name: group.warnings for group in groups}
+    assert warnings == {"Album A": ["Missing tracks in disc 1: [2]"], "Album B": []}
+
+
+def test_album_dao_batch_commits_once_and_rolls_back_on_error(
+    album_manager: AlbumManager, conn: sqlite3.Connection
+) -> None:
+    """Writes inside a batch stay uncommitted until the block exits and vanish if it raises."""
+    dao = album_manager.album_dao
+
+    with dao.batch():
+        album_id = dao.insert_album("Kept", "Artist")
+        assert album_id is not None
+        assert dao.insert_track_positions([(album_id, 1, 1, "hash1"), (album_id, 1, 1, "hash2")]) == [True, False]
+        assert conn.in_transaction
+    assert not conn.in_transaction
+
+    with pytest.raises(RuntimeError), dao.batch():
+        _ = dao.insert_album("Dropped", "Artist")
+        raise RuntimeError("boom")
+
+    assert dao.get_album("Kept", "Artist") is not None
+    assert dao.get_album("Dropped", "Artist") is None
+    assert [track.file_hash for track in dao.get_album_tracks(album_id)] == ["hash1"]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("12", 12),
+        (" 7 ", 7),
+        ("-3", -3),
+        ("+4", 4),
+        ("", None),
+        (None, None),
+        ("1/12", None),
+        ("²", None),
+        ("-", None),
+    ],
+)
+def test_parse_int(value: str | None, expected: int | None) -> None:
+    """Integer tag values parse without raising; anything int() would reject yields None."""
+    assert _parse_int(value) == expected
+
+
+def test_process_files_accepts_a_stream(album_manager: AlbumManager) -> None:
+    """Files can be fed lazily; each pair is consumed once and repeated hashes are ignored."""
+
+    def stream() -> Iterator[tuple[str, dict[str, str | None]]]:
+        for track_number in (1, 2, 2):
+            yield (
+                f"hash{track_number}",
+                {
+                    "album": "Test Album",
+                    "album_artist": "Test Artist",
+                    "disc_number": "1",
+                    "track_number": str(track_number),
+                },
+            )
+
+    (group,), warnings = album_manager.process_files(stream())
+
+    assert warnings == []
+    assert group.file_hashes == ["hash1", "hash2"]
+    assert group.warnings == []
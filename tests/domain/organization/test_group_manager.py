@@ -1,11 +1,11 @@
 """Tests for music grouping behavior."""
 
 from pathlib import Path
-from types import SimpleNamespace
 
 import pytest
 from pytest_mock import MockerFixture
 
+from omym.domain.metadata.track_metadata import TrackMetadata
 from omym.domain.organization.group_manager import MusicGrouper
 
 
@@ -24,7 +24,7 @@ def test_group_by_path_format_normalizes_components(
     file_path = tmp_path / "song.flac"
     file_path.touch()
 
-    metadata = SimpleNamespace(
+    metadata = TrackMetadata(
         title="Song",
         artist="Artist",
         album="Album",
@@ -47,5 +47,69 @@ def test_group_by_path_format_normalizes_components(
 
     assert result != {}
     assert str(file_path) in result
-    assert result[str(file_path)]["album_artist"] == "Album Artist"
-    assert result[str(file_path)]["album"] == "Album"
+    assert result[str(file_path)].album_artist == "Album Artist"
+    assert result[str(file_path)].album == "Album"
+
+
+def test_group_by_path_format_skips_missing_year(
+    tmp_path: Path,
+    mocker: MockerFixture,
+    music_grouper: MusicGrouper,
+) -> None:
+    """Files without a year are skipped when the format requires one."""
+    file_path = tmp_path / "song.flac"
+    file_path.touch()
+
+    _ = mocker.patch(
+        "omym.domain.metadata.track_metadata_extractor.MetadataExtractor.extract",
+        return_value=TrackMetadata(album_artist="Album Artist", album="Album"),
+    )
+
+    assert music_grouper.group_by_path_format([file_path], "AlbumArtist/Year") == {}
+
+
+def test_group_by_path_format_keeps_order_and_skips_failures(
+    tmp_path: Path,
+    mocker: MockerFixture,
+    music_grouper: MusicGrouper,
+) -> None:
+    """Parallel extraction keeps file order and skips files whose extraction raises."""
+    files = [tmp_path / f"song{index}.flac" for index in range(6)]
+
+    def extract(file_path: Path) -> TrackMetadata:
+        if file_path.name == "song2.flac":
+            raise OSError("unreadable")
+        return TrackMetadata(album_artist="Album Artist", album=file_path.stem)
+
+    _ = mocker.patch(
+        "omym.domain.metadata.track_metadata_extractor.MetadataExtractor.extract",
+        side_effect=extract,
+    )
+
+    result = music_grouper.group_by_path_format(files, "AlbumArtist/Album")
+
+    assert list(result) == [str(path) for path in files if path.name != "song2.flac"]
+    assert [metadata.album for metadata in result.values()] == ["song0", "song1", "song3", "song4", "song5"]
+
+
+def test_group_by_path_format_shares_album_strings(
+    tmp_path: Path,
+    mocker: MockerFixture,
+    music_grouper: MusicGrouper,
+) -> None:
+    """Tracks of the same album share one string object for album and album artist."""
+    files = [tmp_path / "one.flac", tmp_path / "two.flac"]
+
+    def extract(_file_path: Path) -> TrackMetadata:
+        # Build the names at runtime so each call returns distinct string objects.
+        return TrackMetadata(album_artist="".join(["Album ", "Artist"]), album="".join(["Al", "bum"]))
+
+    _ = mocker.patch(
+        "omym.domain.metadata.track_metadata_extractor.MetadataExtractor.extract",
+        side_effect=extract,
+    )
+
+    first, second = music_grouper.group_by_path_format(files, "AlbumArtist/Album").values()
+
+    assert first.album is second.album
+    assert first.album_artist is second.album_artist
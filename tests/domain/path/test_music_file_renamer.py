@@ -1,7 +1,11 @@
 """Test renaming logic functionality."""
 
+from collections.abc import Generator
 from pathlib import Path
 
+import pytest
+from pytest_mock import MockerFixture
+
 from omym.domain.path.music_file_renamer import (
     ArtistIdGenerator,
     CachedArtistIdGenerator,
@@ -12,6 +16,14 @@ from omym.infra.db.cache.artist_cache_dao import ArtistCacheDAO
 from omym.infra.db.db_manager import DatabaseManager
 
 
+@pytest.fixture(autouse=True)
+def clear_latinization_cache() -> Generator[None, None, None]:
+    """Keep memoized latinization from leaking between tests that patch its helpers."""
+    ArtistIdGenerator._latinize_cached.cache_clear()  # pyright: ignore[reportPrivateUsage] - reset process-wide cache
+    yield
+    ArtistIdGenerator._latinize_cached.cache_clear()  # pyright: ignore[reportPrivateUsage] - reset process-wide cache
+
+
 class TestArtistIdGenerator:
     """Test cases for ArtistIdGenerator class."""
 
@@ -78,6 +90,28 @@ class TestArtistIdGenerator:
         # Test name with mixed case
         assert ArtistIdGenerator.generate("JoHn SmItH") == "JHNSM"
 
+    def test_generate_memoizes_latinization(self, mocker: MockerFixture) -> None:
+        """Names differing only in surrounding whitespace are transliterated once."""
+        transliterate = mocker.spy(ArtistIdGenerator, "_transliterate_japanese")
+
+        first = ArtistIdGenerator.generate("やまだたろう")
+        second = ArtistIdGenerator.generate("  やまだたろう ")
+
+        assert first == second == "YMDTR"
+        assert transliterate.call_count == 1
+
+    def test_generate_does_not_memoize_failures(self, mocker: MockerFixture) -> None:
+        """A failed transliteration keeps the original text and is retried on the next call."""
+        transliterate = mocker.patch.object(
+            ArtistIdGenerator,
+            "_transliterate_japanese",
+            side_effect=["やまだたろう", "YAMADATARO"],  # Failure returns the input unchanged.
+        )
+
+        assert ArtistIdGenerator.generate("やまだたろう") != "YMDTR"
+        assert ArtistIdGenerator.generate("やまだたろう") == "YMDTR"
+        assert transliterate.call_count == 2
+
 
 class TestCachedArtistIdGenerator:
     """Test cases for CachedArtistIdGenerator class."""
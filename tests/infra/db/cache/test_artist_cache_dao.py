@@ -45,3 +45,14 @@ class TestArtistCacheDAO:
         assert dao.upsert_romanized_name("米津玄師", "Yonezu Kenshi", source="manual") is True
         assert dao.get_romanized_name("米津玄師") == "Yonezu Kenshi"
         assert dao.get_artist_id("米津玄師") == "YONEZ"
+
+    def test_get_romanized_names_returns_cached_subset(self, tmp_path: Path) -> None:
+        dao = self._create_dao(tmp_path)
+
+        assert dao.upsert_romanized_name("米津玄師", "Kenshi Yonezu") is True
+        assert dao.upsert_romanized_name("Queen", "Queen") is True
+        assert dao.insert_artist_id("宇多田ヒカル", "UTADA") is True
+
+        resolved = dao.get_romanized_names([" 米津玄師 ", "QUEEN", "宇多田ヒカル", "", "Unknown"])
+
+        assert resolved == {"米津玄師": "Kenshi Yonezu", "QUEEN": "Queen"}
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from omym.infra.db.cache.file_hash_cache_dao import FileHashCacheDAO
+from omym.infra.db.db_manager import DatabaseManager
+
+
+class TestFileHashCacheDAO:
+    """Integration tests for FileHashCacheDAO."""
+
+    def _create_dao(self, tmp_path: Path) -> FileHashCacheDAO:
+        db_path = tmp_path / "cache.db"
+        manager = DatabaseManager(db_path)
+        manager.connect()
+        assert manager.conn is not None
+        return FileHashCacheDAO(manager.conn)
+
+    def test_hit_requires_matching_size_and_mtime(self, tmp_path: Path) -> None:
+        dao = self._create_dao(tmp_path)
+        unchanged = Path("/music/unchanged.flac")
+        touched = Path("/music/touched.flac")
+
+        assert dao.upsert_hashes([(unchanged, 10, 100, "hash-a"), (touched, 20, 200, "hash-b")]) is True
+
+        hits = dao.get_cached_hashes(
+            {
+                unchanged: (10, 100),
+                touched: (20, 201),
+                Path("/music/unknown.flac"): (30, 300),
+            }
+        )
+
+        assert hits == {unchanged: "hash-a"}
+
+    def test_upsert_refreshes_existing_entry(self, tmp_path: Path) -> None:
+        dao = self._create_dao(tmp_path)
+        path = Path("/music/track.mp3")
+
+        assert dao.upsert_hashes([(path, 10, 100, "old")]) is True
+        assert dao.upsert_hashes([(path, 11, 101, "new")]) is True
+
+        assert dao.get_cached_hashes({path: (11, 101)}) == {path: "new"}
+        assert dao.get_cached_hashes({path: (10, 100)}) == {}
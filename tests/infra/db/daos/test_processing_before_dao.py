@@ -18,7 +18,13 @@ def dao_with_connection() -> Iterator[tuple[ProcessingBeforeDAO, sqlite3.Connect
     """Provide a DAO instance with an in-memory SQLite connection."""
     conn = sqlite3.connect(":memory:")
     _ = conn.execute(
-        "CREATE TABLE processing_before (file_hash TEXT PRIMARY KEY, file_path TEXT NOT NULL UNIQUE)"
+        """
+        CREATE TABLE processing_before (
+            file_hash TEXT PRIMARY KEY,
+            file_path TEXT NOT NULL UNIQUE,
+            updated_at TIMESTAMP
+        )
+        """
     )
     try:
         yield ProcessingBeforeDAO(conn), conn
@@ -69,3 +75,36 @@ def test_get_source_and_file_path_handle_sql_error(
     assert dao.get_source_path("any-hash") is None
     assert dao.get_file_path("any-hash") is None
     assert mock_cursor.execute.call_count == 2
+
+
+def test_insert_many_upserts_all_rows(
+    dao_with_connection: tuple[ProcessingBeforeDAO, sqlite3.Connection],
+) -> None:
+    """Ensure batched inserts store every row and update paths on conflict."""
+    dao, _conn = dao_with_connection
+
+    assert dao.insert_many([("hash-1", Path("/music/a.flac")), ("hash-2", Path("/music/b.flac"))])
+    assert dao.insert_many([("hash-1", Path("/music/c.flac"))])
+
+    assert dao.get_file_path("hash-1") == Path("/music/c.flac")
+    assert dao.get_file_path("hash-2") == Path("/music/b.flac")
+
+
+def test_get_target_paths_returns_recorded_targets(
+    dao_with_connection: tuple[ProcessingBeforeDAO, sqlite3.Connection],
+) -> None:
+    """Ensure the bulk lookup returns targets only for hashes with a processing_after row."""
+    dao, conn = dao_with_connection
+    _ = conn.execute("CREATE TABLE processing_after (file_hash TEXT PRIMARY KEY, target_path TEXT)")
+    _ = conn.executemany(
+        "INSERT INTO processing_before (file_hash, file_path) VALUES (?, ?)",
+        [("hash-a", "/music/a.flac"), ("hash-b", "/music/b.flac")],
+    )
+    _ = conn.execute(
+        "INSERT INTO processing_after (file_hash, target_path) VALUES (?, ?)",
+        ("hash-a", "/library/a.flac"),
+    )
+
+    targets = dao.get_target_paths(["hash-a", "hash-b", "hash-missing", "hash-a"])
+
+    assert targets == {"hash-a": Path("/library/a.flac")}
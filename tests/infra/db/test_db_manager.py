@@ -97,6 +97,50 @@ def test_database_connection() -> None:
         manager.close()
 
 
+def test_database_bulk_pragmas(tmp_path: Path) -> None:
+    """Connections are tuned for bulk inserts."""
+    manager = DatabaseManager(tmp_path / "omym.db")
+    manager.connect()
+
+    try:
+        assert manager.conn is not None
+        assert manager.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert manager.conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert manager.conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+    finally:
+        manager.close()
+
+
+def test_reader_connections_are_read_only_and_pooled(tmp_path: Path) -> None:
+    """Reader connections see committed rows, reject writes, and are reused round-robin."""
+    manager = DatabaseManager(tmp_path / "omym.db")
+    manager.connect()
+
+    try:
+        assert manager.conn is not None
+        _ = manager.conn.execute(
+            "INSERT INTO processing_before (file_hash, file_path) VALUES (?, ?)",
+            ("hash-1", "/music/a.flac"),
+        )
+        manager.conn.commit()
+
+        readers = [manager.get_reader_connection() for _ in range(DatabaseManager.READER_POOL_SIZE + 1)]
+
+        assert readers[0] is not manager.conn
+        assert readers[-1] is readers[0]
+        row = readers[0].execute("SELECT file_path FROM processing_before").fetchone()
+        assert row[0] == "/music/a.flac"
+        with pytest.raises(sqlite3.OperationalError):
+            _ = readers[0].execute("DELETE FROM processing_before")
+    finally:
+        manager.close()
+
+
+def test_reader_connection_falls_back_to_writer_in_memory(db_manager: DatabaseManager) -> None:
+    """In-memory databases cannot be shared, so readers reuse the writer connection."""
+    assert db_manager.get_reader_connection() is db_manager.conn
+
+
 def test_database_error_handling() -> None:
     """Test database error handling."""
     # Try to connect with invalid path
@@ -0,0 +1,51 @@
+"""Tests for moving logger handlers onto a background listener."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+
+from omym.infra.logger.logger import queued_log_handlers
+
+
+class _RecordingHandler(logging.Handler):
+    """Handler that remembers emitted records and the thread that emitted them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.threads: set[str] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+def test_queued_log_handlers_emits_off_thread_and_restores_handlers() -> None:
+    """Records reach the original handler intact and handlers are restored on exit."""
+
+    target = logging.getLogger("omym.tests.queued")
+    target.propagate = False
+    target.setLevel(logging.DEBUG)
+    handler = _RecordingHandler()
+    target.addHandler(handler)
+
+    try:
+        with queued_log_handlers(target):
+            assert handler not in target.handlers
+            with queued_log_handlers(target):  # Nested use keeps the single listener.
+                try:
+                    raise ValueError("boom")
+                except ValueError:
+                    target.exception("moved %s", "track", extra={"source_path": Path("/a.mp3")})
+
+        assert target.handlers == [handler]
+        assert len(handler.records) == 1
+        record = handler.records[0]
+        assert record.getMessage() == "moved track"
+        assert record.exc_info is not None
+        assert getattr(record, "source_path") == Path("/a.mp3")
+        assert threading.current_thread().name not in handler.threads
+    finally:
+        target.removeHandler(handler)
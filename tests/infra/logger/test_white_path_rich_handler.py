@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from io import StringIO
+from pathlib import Path
 from typing import Any
 
 from rich.console import Console
@@ -110,3 +111,20 @@ def test_render_message_handles_windows_paths() -> None:
     plain = rendered.plain
     assert "Artist\\Album\\Disc\\Track.flac" in plain
     assert "C:\\media" not in plain
+
+
+def test_render_message_accepts_path_objects() -> None:
+    """Raw ``Path`` extras are stringified by the handler when rendering."""
+
+    handler = _make_handler()
+    record = _build_record(
+        processing_event="processing.file.move",
+        source_path=Path("/music/incoming/track.flac"),
+        source_base_path=Path("/music/incoming"),
+        target_path=Path("/library/Artist/track.flac"),
+        target_base_path=Path("/library"),
+    )
+
+    rendered = handler.render_message(record, "")
+    assert isinstance(rendered, Text)
+    assert "track.flac → Artist/track.flac" in rendered.plain